@@ -1,14 +1,24 @@
 """Base analyzer class for diagnostic analysis."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import ClassVar, FrozenSet, List
+
+import numpy as np
 
 from ..models.session import DiagnosticSession, AnalysisResult, AnalysisFinding
 
 
+# Stand-in for a PID the session never reported, shared by the analyzers
+NO_VALUES = np.empty(0)
+NO_VALUES.flags.writeable = False
+
+
 class BaseAnalyzer(ABC):
     """Abstract base class for all analyzers."""
 
+    # PIDs the analyzer draws on, fixed per analyzer class
+    REQUIRED_PIDS: ClassVar[FrozenSet[str]] = frozenset()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -21,15 +31,14 @@ class BaseAnalyzer(ABC):
         """Analyzer description."""
         pass
 
-    @abstractmethod
-    def get_required_pids(self) -> List[str]:
+    def get_required_pids(self) -> FrozenSet[str]:
         """
         Get PIDs required for this analysis.
 
         Returns:
-            List of required PID names
+            Set of required PID names, shared by all instances of the analyzer
         """
-        pass
+        return self.REQUIRED_PIDS
 
     @abstractmethod
     def analyze(self, session: DiagnosticSession) -> AnalysisResult:
@@ -116,15 +125,5 @@ class BaseAnalyzer(ABC):
         Returns:
             True if has required data
         """
-        if not session.pid_samples:
-            return False
-
-        required_pids = set(self.get_required_pids())
-
-        # Check if any sample has the required PIDs
-        for sample in session.pid_samples:
-            available_pids = set(sample.values.keys())
-            if required_pids & available_pids:  # Any overlap
-                return True
-
-        return False
+        # Any overlap between the PIDs seen in the session and the required ones
+        return not session.available_pids.isdisjoint(self.REQUIRED_PIDS)
@@ -1,16 +1,165 @@
 """Statistical correlator for analyzing sensor relationships."""
 
-from typing import List, Dict, Tuple, Optional
-import statistics
-import math
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import combinations
+from typing import List, Dict, Optional, Tuple, Union
+
+import numpy as np
 
 from .base import BaseAnalyzer
-from ..models.session import DiagnosticSession, AnalysisResult, AnalysisFinding
+from ..models.session import DiagnosticSession, AnalysisResult, AnalysisFinding, PIDSample
+
+
+def _empty_sums() -> np.ndarray:
+    return np.zeros((0, 0))
+
+
+@dataclass
+class CorrelationState:
+    """
+    Running sums for incremental Pearson correlation between PIDs.
+
+    Entry [i, j] of each matrix covers only the samples in which both PID i
+    and PID j were present, so row i of sum_x is the sum of PID i over those
+    samples. Values are shifted by each PID's first reading to keep the sums
+    numerically stable.
+    """
+    pids: List[str] = field(default_factory=list)
+    shift: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    count: np.ndarray = field(default_factory=_empty_sums)
+    sum_x: np.ndarray = field(default_factory=_empty_sums)
+    sum_sq: np.ndarray = field(default_factory=_empty_sums)
+    sum_xy: np.ndarray = field(default_factory=_empty_sums)
+    source: Optional[List[PIDSample]] = None
+    synced: int = 0
+
+    def update(self, samples: List[PIDSample]) -> None:
+        """
+        Fold samples appended since the last update into the sums.
+
+        Args:
+            samples: The session's sample list
+        """
+        # A different or shrunk sample list invalidates the sums
+        if samples is not self.source or len(samples) < self.synced:
+            self._reset(samples)
+
+        new_samples = samples[self.synced:]
+        self.synced = len(samples)
+        if not new_samples:
+            return
+
+        index = {pid: i for i, pid in enumerate(self.pids)}
+        known = len(index)
+        for sample in new_samples:
+            for pid in sample.values:
+                if pid not in index:
+                    index[pid] = len(index)
+        if len(index) > known:
+            self._grow(list(index))
+
+        batch = np.full((len(new_samples), len(index)), np.nan)
+        for row, sample in zip(batch, new_samples):
+            for pid, value in sample.values.items():
+                row[index[pid]] = value
+
+        # New PIDs are shifted by their first reading
+        for col in range(known, len(index)):
+            column = batch[:, col]
+            self.shift[col] = column[~np.isnan(column)][0]
+
+        batch -= self.shift
+        present = ~np.isnan(batch)
+        batch[~present] = 0.0
+        mask = present.astype(np.float64)
+
+        self.count += mask.T @ mask
+        self.sum_x += batch.T @ mask
+        self.sum_sq += (batch * batch).T @ mask
+        self.sum_xy += batch.T @ batch
+
+    def _reset(self, source: List[PIDSample]) -> None:
+        """Drop all sums and start over on a new sample list."""
+        self.pids = []
+        self.shift = np.zeros(0)
+        self.count = _empty_sums()
+        self.sum_x = _empty_sums()
+        self.sum_sq = _empty_sums()
+        self.sum_xy = _empty_sums()
+        self.source = source
+        self.synced = 0
+
+    def _grow(self, pids: List[str]) -> None:
+        """Extend the sums with zeroed entries for newly seen PIDs."""
+        extra = len(pids) - len(self.pids)
+        self.pids = pids
+        self.shift = np.pad(self.shift, (0, extra))
+        self.count = np.pad(self.count, (0, extra))
+        self.sum_x = np.pad(self.sum_x, (0, extra))
+        self.sum_sq = np.pad(self.sum_sq, (0, extra))
+        self.sum_xy = np.pad(self.sum_xy, (0, extra))
+
+    def correlation_matrix(self, pids: List[str], min_count: int = 10) -> np.ndarray:
+        """
+        Pearson correlations between the given PIDs from the running sums.
+
+        Args:
+            pids: PIDs to correlate, all previously seen by update()
+            min_count: Fewest shared samples for a pair to be correlated
+
+        Returns:
+            (PIDs x PIDs) matrix, NaN where a pair has too few shared samples
+            or one side is constant
+        """
+        index = {pid: i for i, pid in enumerate(self.pids)}
+        cols = [index[pid] for pid in pids]
+        block = np.ix_(cols, cols)
+
+        n = self.count[block]
+        sum_x = self.sum_x[block]
+        var = n * self.sum_sq[block] - sum_x * sum_x
+        cov = n * self.sum_xy[block] - sum_x * sum_x.T
+
+        valid = (n >= min_count) & (var > 0) & (var.T > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.sqrt(var * var.T)
+        return np.where(valid, np.clip(corr, -1.0, 1.0), np.nan)
 
 
 class Correlator(BaseAnalyzer):
     """Analyzes correlations between sensor readings to identify anomalies."""
 
+    REQUIRED_PIDS = frozenset({
+        "RPM",
+        "SPEED",
+        "ENGINE_LOAD",
+        "THROTTLE_POS",
+        "MAF",
+        "COOLANT_TEMP",
+    })
+
+    def __init__(self, z_threshold: float = 3.0):
+        """
+        Initialize correlator.
+
+        Args:
+            z_threshold: Standard deviations beyond which a reading, a
+                sample-to-sample jump or a baseline deviation is flagged
+        """
+        self._z_threshold = z_threshold
+
+        # Running correlation sums, folded forward as the session grows
+        self._correlation_state = CorrelationState()
+
+        # Session the state below belongs to, held weakly so the analyzer
+        # does not keep it (or its samples) alive
+        self._session_ref: Optional["weakref.ref[DiagnosticSession]"] = None
+
+        # Last result as (series version, result)
+        self._last_result: Optional[Tuple[int, AnalysisResult]] = None
+
     @property
     def name(self) -> str:
         return "Statistical Correlation Analysis"
@@ -19,11 +168,42 @@ class Correlator(BaseAnalyzer):
     def description(self) -> str:
         return "Identifies unusual patterns and correlations in sensor data"
 
-    def get_required_pids(self) -> List[str]:
-        return ["RPM", "SPEED", "ENGINE_LOAD", "THROTTLE_POS", "MAF", "COOLANT_TEMP"]
+    @property
+    def z_threshold(self) -> float:
+        """Standard deviations at which values are flagged as anomalous."""
+        return self._z_threshold
 
     def analyze(self, session: DiagnosticSession) -> AnalysisResult:
-        """Perform correlation analysis."""
+        """
+        Perform correlation analysis.
+
+        Repeated calls on a session whose PID data has not changed reuse the
+        previous analysis instead of recomputing it; each call still gets
+        its own copy of the result. Changes are detected through
+        session.series_version, so values edited in place inside existing
+        samples are not picked up.
+        """
+        ref = self._session_ref
+        if ref is None or ref() is not session:
+            self._forget_session(ref)
+            self._session_ref = weakref.ref(session, self._forget_session)
+
+        version = session.series_version
+        cached = self._last_result
+        if cached is None or cached[0] != version:
+            cached = self._last_result = (version, self._analyze(session))
+
+        return cached[1].model_copy(deep=True, update={"timestamp": datetime.now()})
+
+    def _forget_session(self, ref: Optional["weakref.ref[DiagnosticSession]"]) -> None:
+        """Drop the result and running sums kept for a session."""
+        if ref is self._session_ref:
+            self._session_ref = None
+            self._last_result = None
+            self._correlation_state = CorrelationState()
+
+    def _analyze(self, session: DiagnosticSession) -> AnalysisResult:
+        """Run the full correlation analysis on a session."""
         findings = []
         metrics = {}
 
@@ -37,8 +217,9 @@ class Correlator(BaseAnalyzer):
                 summary="Insufficient data for correlation analysis"
             )
 
-        # Extract time series for each PID
-        series = self._extract_series(session)
+        # Extract time series for each PID, unless the session's known
+        # PID set already rules out a pair
+        series = self._extract_series(session) if len(session.available_pids) >= 2 else {}
 
         if len(series) < 2:
             return self.create_result(
@@ -51,17 +232,15 @@ class Correlator(BaseAnalyzer):
             )
 
         # Calculate correlations between key pairs
-        correlations = self._calculate_correlations(series)
-        metrics["correlations"] = correlations
+        correlations = self._calculate_correlations(session, series)
+        for (pid1, pid2), corr in correlations.items():
+            metrics[f"correlation_{pid1}_{pid2}"] = corr
 
         # Analyze expected vs actual correlations
         findings.extend(self._analyze_expected_correlations(correlations, series))
 
-        # Detect anomalies
-        findings.extend(self._detect_anomalies(series))
-
-        # Trend analysis
-        findings.extend(self._analyze_trends(series))
+        # Detect anomalies and trends
+        findings.extend(self._analyze_pids(series))
 
         # Generate summary
         anomaly_count = sum(1 for f in findings if f.severity in ("critical", "warning"))
@@ -72,66 +251,39 @@ class Correlator(BaseAnalyzer):
 
         return self.create_result(findings=findings, summary=summary, metrics=metrics)
 
-    def _extract_series(self, session: DiagnosticSession) -> Dict[str, List[float]]:
+    def _extract_series(self, session: DiagnosticSession) -> Dict[str, np.ndarray]:
         """Extract time series data for each PID."""
-        series = {}
-
-        for sample in session.pid_samples:
-            for pid, value in sample.values.items():
-                if pid not in series:
-                    series[pid] = []
-                series[pid].append(float(value))
-
         # Only keep series with enough data points
-        return {k: v for k, v in series.items() if len(v) >= 10}
+        return {
+            pid: values
+            for pid, values in session.get_pid_arrays(np.float32).items()
+            if len(values) >= 10
+        }
 
     def _calculate_correlations(
         self,
-        series: Dict[str, List[float]]
+        session: DiagnosticSession,
+        series: Dict[str, np.ndarray]
     ) -> Dict[Tuple[str, str], float]:
-        """Calculate Pearson correlations between PID pairs."""
+        """Calculate Pearson correlations between all PID pairs."""
         correlations = {}
         pids = list(series.keys())
 
-        for i in range(len(pids)):
-            for j in range(i + 1, len(pids)):
-                pid1, pid2 = pids[i], pids[j]
-                values1 = series[pid1]
-                values2 = series[pid2]
+        # Only samples added since the previous call are processed
+        state = self._correlation_state
+        state.update(session.pid_samples)
+        corr = state.correlation_matrix(pids)
 
-                # Align lengths
-                min_len = min(len(values1), len(values2))
-                if min_len < 10:
-                    continue
-
-                corr = self._pearson_correlation(values1[:min_len], values2[:min_len])
-                if corr is not None:
-                    correlations[(pid1, pid2)] = corr
+        for (i, pid1), (j, pid2) in combinations(enumerate(pids), 2):
+            if not np.isnan(corr[i, j]):
+                correlations[(pid1, pid2)] = float(corr[i, j])
 
         return correlations
 
-    def _pearson_correlation(self, x: List[float], y: List[float]) -> Optional[float]:
-        """Calculate Pearson correlation coefficient."""
-        n = len(x)
-        if n != len(y) or n < 2:
-            return None
-
-        mean_x = statistics.mean(x)
-        mean_y = statistics.mean(y)
-
-        numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-        denom_x = math.sqrt(sum((xi - mean_x) ** 2 for xi in x))
-        denom_y = math.sqrt(sum((yi - mean_y) ** 2 for yi in y))
-
-        if denom_x == 0 or denom_y == 0:
-            return None
-
-        return numerator / (denom_x * denom_y)
-
     def _analyze_expected_correlations(
         self,
         correlations: Dict[Tuple[str, str], float],
-        series: Dict[str, List[float]]
+        series: Dict[str, np.ndarray]
     ) -> List[AnalysisFinding]:
         """Check if expected correlations exist."""
         findings = []
@@ -173,102 +325,134 @@ class Correlator(BaseAnalyzer):
 
         return findings
 
-    def _detect_anomalies(self, series: Dict[str, List[float]]) -> List[AnalysisFinding]:
-        """Detect statistical anomalies in data."""
+    def _analyze_pids(self, series: Dict[str, np.ndarray]) -> List[AnalysisFinding]:
+        """Detect anomalies and trends across all PIDs with enough data."""
         findings = []
 
-        for pid, values in series.items():
-            if len(values) < 20:
-                continue
-
-            mean = statistics.mean(values)
-            std = statistics.stdev(values)
+        pids = [pid for pid, values in series.items() if len(values) >= 20]
+        if not pids:
+            return findings
 
-            if std == 0:
-                continue
-
-            # Find outliers (>3 standard deviations)
-            outliers = [v for v in values if abs(v - mean) > 3 * std]
+        stats = self._pid_statistics([series[pid] for pid in pids], self._z_threshold)
+        for pid, *pid_stats in zip(pids, *stats):
+            findings.extend(self._pid_findings(pid, *pid_stats))
 
-            if len(outliers) > len(values) * 0.05:  # More than 5% outliers
-                findings.append(self.create_finding(
-                    f"Data Anomalies in {pid}",
-                    f"Found {len(outliers)} outlier readings ({len(outliers)/len(values)*100:.1f}%) "
-                    f"in {pid} data. This may indicate sensor issues or unusual conditions.",
-                    severity="info",
-                    category="anomaly",
-                    confidence=0.5,
-                    related_pids=[pid],
-                ))
+        return findings
 
-            # Check for sudden spikes
-            spikes = []
-            for i in range(1, len(values)):
-                if abs(values[i] - values[i-1]) > 3 * std:
-                    spikes.append(i)
+    @staticmethod
+    def _pid_statistics(
+        columns: List[np.ndarray],
+        z_threshold: float
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Compute anomaly and trend statistics for many PIDs in one pass.
 
-            if len(spikes) > 5:
-                findings.append(self.create_finding(
-                    f"Sudden Changes in {pid}",
-                    f"Detected {len(spikes)} sudden value changes in {pid}. "
-                    "This may indicate intermittent sensor issues.",
-                    severity="warning",
-                    category="anomaly",
-                    confidence=0.6,
-                    related_pids=[pid],
-                ))
+        Series are stacked into a NaN-padded float32 (PIDs x samples) matrix
+        so every statistic is a single row-wise reduction.
 
-        return findings
+        Args:
+            columns: Per-PID value arrays, each with at least two samples
+            z_threshold: z-score beyond which a reading or jump is counted
 
-    def _analyze_trends(self, series: Dict[str, List[float]]) -> List[AnalysisFinding]:
-        """Analyze data for concerning trends."""
+        Returns:
+            Tuple of per-PID arrays: (count, mean, std, outliers, spikes, slope)
+        """
+        counts = np.array([len(values) for values in columns])
+        matrix = np.full((len(columns), counts.max()), np.nan, dtype=np.float32)
+        for row, values in zip(matrix, columns):
+            row[:len(values)] = values
+
+        # Elementwise work stays in float32; reductions accumulate in float64
+        n = counts.astype(np.float64)
+        means = np.nanmean(matrix, axis=1, dtype=np.float64)
+        centered = matrix - means.astype(np.float32)[:, None]
+        stds = np.sqrt(np.nansum(centered * centered, axis=1, dtype=np.float64) / (n - 1))
+
+        # One z-score matrix feeds both outlier and spike counts; flat rows
+        # get z = 0. Padding is NaN, and NaN comparisons are False
+        scale = np.divide(1.0, stds, out=np.zeros_like(stds), where=stds > 0)
+        z_scores = centered * scale.astype(np.float32)[:, None]
+        outliers = (np.abs(z_scores) > z_threshold).sum(axis=1)
+        spikes = (np.abs(np.diff(z_scores, axis=1)) > z_threshold).sum(axis=1)
+
+        # Least-squares slope against x = 0..n-1, whose centered
+        # sum of squares is n(n^2 - 1)/12
+        index = (np.arange(matrix.shape[1]) - (n[:, None] - 1) / 2).astype(np.float32)
+        slopes = np.nansum(index * centered, axis=1, dtype=np.float64) / (n * (n * n - 1) / 12.0)
+
+        return counts, means, stds, outliers, spikes, slopes
+
+    def _pid_findings(
+        self,
+        pid: str,
+        n: int,
+        mean: float,
+        std: float,
+        outlier_count: int,
+        spike_count: int,
+        slope: float
+    ) -> List[AnalysisFinding]:
+        """Turn one PID's anomaly and trend statistics into findings."""
         findings = []
 
-        for pid, values in series.items():
-            if len(values) < 20:
-                continue
-
-            # Check for consistent upward/downward trend
-            # Using simple linear regression slope
-            n = len(values)
-            x_mean = (n - 1) / 2
-            y_mean = statistics.mean(values)
-
-            numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
-            denominator = sum((i - x_mean) ** 2 for i in range(n))
+        # A flat series has neither anomalies nor a trend
+        if std == 0:
+            return findings
 
-            if denominator == 0:
-                continue
+        if outlier_count > n * 0.05:  # More than 5% outliers
+            findings.append(self.create_finding(
+                f"Data Anomalies in {pid}",
+                f"Found {outlier_count} outlier readings ({outlier_count/n*100:.1f}%) "
+                f"in {pid} data. This may indicate sensor issues or unusual conditions.",
+                severity="info",
+                category="anomaly",
+                confidence=0.5,
+                related_pids=[pid],
+            ))
 
-            slope = numerator / denominator
+        # Check for sudden spikes
+        if spike_count > 5:
+            findings.append(self.create_finding(
+                f"Sudden Changes in {pid}",
+                f"Detected {spike_count} sudden value changes in {pid}. "
+                "This may indicate intermittent sensor issues.",
+                severity="warning",
+                category="anomaly",
+                confidence=0.6,
+                related_pids=[pid],
+            ))
 
-            # Normalize slope by mean value
-            if y_mean != 0:
-                relative_slope = slope / y_mean * 100
+        # Normalize slope by mean value
+        if mean != 0:
+            relative_slope = slope / mean * 100
 
-                # Significant trend if >1% change per sample on average
-                if abs(relative_slope) > 1:
-                    direction = "increasing" if slope > 0 else "decreasing"
-                    findings.append(self.create_finding(
-                        f"Trending {pid}",
-                        f"{pid} shows a consistent {direction} trend "
-                        f"({relative_slope:.2f}% per sample). "
-                        "This may indicate a developing issue.",
-                        severity="info" if abs(relative_slope) < 2 else "warning",
-                        category="trend",
-                        confidence=0.5,
-                        related_pids=[pid],
-                    ))
+            # Significant trend if >1% change per sample on average
+            if abs(relative_slope) > 1:
+                direction = "increasing" if slope > 0 else "decreasing"
+                findings.append(self.create_finding(
+                    f"Trending {pid}",
+                    f"{pid} shows a consistent {direction} trend "
+                    f"({relative_slope:.2f}% per sample). "
+                    "This may indicate a developing issue.",
+                    severity="info" if abs(relative_slope) < 2 else "warning",
+                    category="trend",
+                    confidence=0.5,
+                    related_pids=[pid],
+                ))
 
         return findings
 
     def calculate_baseline(
         self,
-        series: Dict[str, List[float]]
+        series: Dict[str, Union[List[float], np.ndarray]]
     ) -> Dict[str, Dict[str, float]]:
         """
         Calculate baseline statistics for each PID.
 
+        Args:
+            series: PID values as lists or float arrays; arrays such as
+                those from session.get_pid_arrays() are used without copying
+
         Returns:
             Dictionary of PID -> {mean, std, min, max, median}
         """
@@ -278,12 +462,15 @@ class Correlator(BaseAnalyzer):
             if len(values) < 5:
                 continue
 
+            # Convert once so every statistic runs as a C loop
+            values = np.asarray(values, dtype=np.float64)
             baselines[pid] = {
-                "mean": statistics.mean(values),
-                "std": statistics.stdev(values) if len(values) > 1 else 0,
-                "min": min(values),
-                "max": max(values),
-                "median": statistics.median(values),
+                "mean": float(values.mean()),
+                # A flat series must report exactly zero spread
+                "std": float(values.std(ddof=1)) if np.ptp(values) > 0 else 0.0,
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "median": float(np.median(values)),
             }
 
         return baselines
@@ -305,26 +492,47 @@ class Correlator(BaseAnalyzer):
         """
         findings = []
 
-        for pid, value in current.items():
-            if pid not in baseline:
-                continue
+        pids, means, stds = self._pack_baseline(baseline)
+        if not pids:
+            return findings
 
-            bl = baseline[pid]
-            if bl["std"] == 0:
-                continue
+        values = np.fromiter(
+            (current.get(pid, np.nan) for pid in pids), dtype=np.float64, count=len(pids)
+        )
 
-            # Calculate z-score
-            z_score = (value - bl["mean"]) / bl["std"]
+        # Calculate all z-scores at once; PIDs missing from current or
+        # with a flat baseline come out as NaN and never exceed the limit
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = (values - means) / np.where(stds == 0, np.nan, stds)
 
-            if abs(z_score) > 3:
-                findings.append(self.create_finding(
-                    f"{pid} Outside Normal Range",
-                    f"Current {pid} value ({value:.1f}) is {abs(z_score):.1f} "
-                    f"standard deviations from baseline ({bl['mean']:.1f}).",
-                    severity="warning" if abs(z_score) > 4 else "info",
-                    category="baseline",
-                    confidence=0.7,
-                    related_pids=[pid],
-                ))
+        for i in np.flatnonzero(np.abs(z_scores) > self._z_threshold):
+            pid, value, z_score = pids[i], values[i], abs(z_scores[i])
+            findings.append(self.create_finding(
+                f"{pid} Outside Normal Range",
+                f"Current {pid} value ({value:.1f}) is {z_score:.1f} "
+                f"standard deviations from baseline ({means[i]:.1f}).",
+                severity="warning" if z_score > 4 else "info",
+                category="baseline",
+                confidence=0.7,
+                related_pids=[pid],
+            ))
 
         return findings
+
+    @staticmethod
+    def _pack_baseline(
+        baseline: Dict[str, Dict[str, float]]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Pack baseline statistics into aligned arrays.
+
+        Args:
+            baseline: Baseline statistics from calculate_baseline
+
+        Returns:
+            Tuple of (PID order, mean array, std array)
+        """
+        pids = list(baseline)
+        means = np.array([baseline[pid]["mean"] for pid in pids], dtype=np.float64)
+        stds = np.array([baseline[pid]["std"] for pid in pids], dtype=np.float64)
+        return pids, means, stds
@@ -1,16 +1,48 @@
 """Fault detector for predicting and correlating vehicle issues."""
 
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from typing import List, Dict
-import statistics
 
-from .base import BaseAnalyzer
+import numpy as np
+
+from .base import BaseAnalyzer, NO_VALUES
 from ..models.session import DiagnosticSession, AnalysisResult, AnalysisFinding
-from ..models.dtc import DTCSeverity
+
+
+@dataclass
+class _SensorStats:
+    """Aggregates computed once per analysis and shared between checks."""
+    sample_count: int
+    long_trim_sum: float
+    long_trim_count: int
+    coolant_max: float
+
+    @classmethod
+    def from_arrays(cls, values: Dict[str, np.ndarray], sample_count: int) -> "_SensorStats":
+        """Compute the shared aggregates from the session's PID arrays."""
+        long_trim = values.get("LONG_FUEL_TRIM_1", NO_VALUES)
+        coolant = values.get("COOLANT_TEMP", NO_VALUES)
+        return cls(
+            sample_count=sample_count,
+            long_trim_sum=float(long_trim.sum()),
+            long_trim_count=long_trim.size,
+            coolant_max=float(coolant.max()) if coolant.size else float("-inf"),
+        )
 
 
 class FaultDetector(BaseAnalyzer):
     """Detects and predicts potential vehicle faults."""
 
+    REQUIRED_PIDS = frozenset({
+        "COOLANT_TEMP",
+        "RPM",
+        "ENGINE_LOAD",
+        "O2_B1S1",
+        "SHORT_FUEL_TRIM_1",
+        "LONG_FUEL_TRIM_1",
+    })
+
     @property
     def name(self) -> str:
         return "Fault Detection"
@@ -19,9 +51,6 @@ class FaultDetector(BaseAnalyzer):
     def description(self) -> str:
         return "Correlates sensor data and DTCs to detect and predict faults"
 
-    def get_required_pids(self) -> List[str]:
-        return ["COOLANT_TEMP", "RPM", "ENGINE_LOAD", "O2_B1S1", "SHORT_FUEL_TRIM_1", "LONG_FUEL_TRIM_1"]
-
     def analyze(self, session: DiagnosticSession) -> AnalysisResult:
         """Analyze data for potential faults."""
         findings = []
@@ -32,16 +61,19 @@ class FaultDetector(BaseAnalyzer):
             findings.extend(self._analyze_dtcs(session.dtc_result))
             metrics["dtc_count"] = session.dtc_result.total_codes
 
-        # Analyze sensor data for anomalies
+        # Analyze sensor data for anomalies, sharing one set of PID arrays
         if session.pid_samples:
-            findings.extend(self._analyze_sensor_anomalies(session))
-            findings.extend(self._analyze_fuel_system(session))
-            findings.extend(self._analyze_o2_sensors(session))
-            findings.extend(self._correlate_symptoms(session))
+            arrays = session.get_pid_arrays()
+            stats = _SensorStats.from_arrays(arrays, len(session.pid_samples))
+            findings.extend(self._analyze_sensor_anomalies(arrays))
+            findings.extend(self._analyze_fuel_system(arrays, stats))
+            findings.extend(self._analyze_o2_sensors(arrays))
+            findings.extend(self._correlate_symptoms(arrays, stats))
 
         # Generate summary
-        critical_count = sum(1 for f in findings if f.severity == "critical")
-        warning_count = sum(1 for f in findings if f.severity == "warning")
+        severity_counts = Counter(f.severity for f in findings)
+        critical_count = severity_counts["critical"]
+        warning_count = severity_counts["warning"]
 
         if critical_count > 0:
             summary = f"CRITICAL: {critical_count} critical issue(s) detected requiring immediate attention."
@@ -62,9 +94,10 @@ class FaultDetector(BaseAnalyzer):
             return findings
 
         # Check for critical codes
-        critical_codes = [c for c in all_codes if c.severity == DTCSeverity.CRITICAL]
+        critical_codes = dtc_result.critical_codes
         if critical_codes:
-            codes_str = ", ".join(c.code for c in critical_codes)
+            critical_list = [c.code for c in critical_codes]
+            codes_str = ", ".join(critical_list)
             findings.append(self.create_finding(
                 "Critical DTCs Present",
                 f"Critical diagnostic codes detected: {codes_str}. "
@@ -76,20 +109,17 @@ class FaultDetector(BaseAnalyzer):
                     "Address critical codes before driving further",
                     "Consult a professional if unsure",
                 ],
-                related_dtcs=[c.code for c in critical_codes],
+                related_dtcs=critical_list,
             ))
 
         # Check for related codes (same system)
-        systems = {}
-        for code in all_codes:
-            system = code.system
-            if system not in systems:
-                systems[system] = []
-            systems[system].append(code)
+        systems = defaultdict(list)
+        for dtc in all_codes:
+            systems[dtc.system].append(dtc.code)
 
         for system, codes in systems.items():
             if len(codes) > 1:
-                codes_str = ", ".join(c.code for c in codes)
+                codes_str = ", ".join(codes)
                 findings.append(self.create_finding(
                     f"Multiple {system} Codes",
                     f"Multiple codes in the same system: {codes_str}. "
@@ -101,13 +131,11 @@ class FaultDetector(BaseAnalyzer):
                         f"Focus diagnosis on {system} system",
                         "Check for common causes between codes",
                     ],
-                    related_dtcs=[c.code for c in codes],
+                    related_dtcs=codes,
                 ))
 
         # Check for pending codes that match stored codes
-        stored_codes = set(c.code for c in dtc_result.stored_codes)
-        pending_codes = set(c.code for c in dtc_result.pending_codes)
-        recurring = stored_codes & pending_codes
+        recurring = set(dtc_result.stored_code_set & dtc_result.pending_code_set)
 
         if recurring:
             findings.append(self.create_finding(
@@ -122,25 +150,17 @@ class FaultDetector(BaseAnalyzer):
 
         return findings
 
-    def _analyze_sensor_anomalies(self, session: DiagnosticSession) -> List[AnalysisFinding]:
+    def _analyze_sensor_anomalies(self, values: Dict[str, np.ndarray]) -> List[AnalysisFinding]:
         """Detect anomalies in sensor readings."""
         findings = []
 
-        # Collect sensor values
-        values = {}
-        for sample in session.pid_samples:
-            for pid, value in sample.values.items():
-                if pid not in values:
-                    values[pid] = []
-                values[pid].append(value)
-
         # Check coolant temperature trends
         if "COOLANT_TEMP" in values:
             temps = values["COOLANT_TEMP"]
             if len(temps) > 10:
                 # Check for temperature that only goes up (cooling issue)
-                temp_changes = [temps[i] - temps[i-1] for i in range(1, len(temps))]
-                if all(c >= 0 for c in temp_changes[-10:]) and temps[-1] > 100:
+                # over the last 10 changes, i.e. the last 11 readings
+                if temps[-1] > 100 and np.all(np.diff(temps[-11:]) >= 0):
                     findings.append(self.create_finding(
                         "Temperature Rising Continuously",
                         "Coolant temperature is continuously rising without stabilizing. "
@@ -159,7 +179,7 @@ class FaultDetector(BaseAnalyzer):
         # Check for stuck sensors (no variation)
         for pid, vals in values.items():
             if len(vals) > 20:
-                unique_vals = len(set(round(v, 1) for v in vals))
+                unique_vals = np.unique(np.round(vals, 1)).size
                 if unique_vals < 3:
                     findings.append(self.create_finding(
                         f"{pid} Sensor May Be Stuck",
@@ -177,25 +197,22 @@ class FaultDetector(BaseAnalyzer):
 
         return findings
 
-    def _analyze_fuel_system(self, session: DiagnosticSession) -> List[AnalysisFinding]:
+    def _analyze_fuel_system(
+        self,
+        values: Dict[str, np.ndarray],
+        stats: _SensorStats
+    ) -> List[AnalysisFinding]:
         """Analyze fuel system health."""
         findings = []
 
-        short_trim = []
-        long_trim = []
-
-        for sample in session.pid_samples:
-            if "SHORT_FUEL_TRIM_1" in sample.values:
-                short_trim.append(sample.values["SHORT_FUEL_TRIM_1"])
-            if "LONG_FUEL_TRIM_1" in sample.values:
-                long_trim.append(sample.values["LONG_FUEL_TRIM_1"])
+        short_trim = values.get("SHORT_FUEL_TRIM_1", NO_VALUES)
 
-        if not short_trim and not long_trim:
+        if not short_trim.size and not stats.long_trim_count:
             return findings
 
         # Analyze long term fuel trim
-        if long_trim:
-            avg_long = statistics.mean(long_trim)
+        if stats.long_trim_count:
+            avg_long = stats.long_trim_sum / stats.long_trim_count
 
             if avg_long > 15:
                 findings.append(self.create_finding(
@@ -233,8 +250,8 @@ class FaultDetector(BaseAnalyzer):
                 ))
 
         # Analyze short term fuel trim volatility
-        if short_trim and len(short_trim) > 10:
-            std_short = statistics.stdev(short_trim)
+        if len(short_trim) > 10:
+            std_short = float(short_trim.std(ddof=1))
             if std_short > 10:
                 findings.append(self.create_finding(
                     "Erratic Fuel Trim",
@@ -253,20 +270,17 @@ class FaultDetector(BaseAnalyzer):
 
         return findings
 
-    def _analyze_o2_sensors(self, session: DiagnosticSession) -> List[AnalysisFinding]:
+    def _analyze_o2_sensors(self, values: Dict[str, np.ndarray]) -> List[AnalysisFinding]:
         """Analyze O2 sensor behavior."""
         findings = []
 
-        o2_values = []
-        for sample in session.pid_samples:
-            if "O2_B1S1" in sample.values:
-                o2_values.append(sample.values["O2_B1S1"])
+        o2_values = values.get("O2_B1S1", NO_VALUES)
 
         if len(o2_values) < 20:
             return findings
 
-        avg_o2 = statistics.mean(o2_values)
-        std_o2 = statistics.stdev(o2_values)
+        avg_o2 = float(o2_values.mean())
+        std_o2 = float(o2_values.std(ddof=1))
 
         # Check for stuck O2 sensor
         if std_o2 < 0.05:
@@ -308,7 +322,11 @@ class FaultDetector(BaseAnalyzer):
 
         return findings
 
-    def _correlate_symptoms(self, session: DiagnosticSession) -> List[AnalysisFinding]:
+    def _correlate_symptoms(
+        self,
+        values: Dict[str, np.ndarray],
+        stats: _SensorStats
+    ) -> List[AnalysisFinding]:
         """Correlate multiple symptoms to identify root causes."""
         findings = []
 
@@ -322,27 +340,22 @@ class FaultDetector(BaseAnalyzer):
         }
 
         # Check for rough idle (RPM variance at idle)
-        rpm_values = []
-        for sample in session.pid_samples:
-            if "RPM" in sample.values and sample.values["RPM"] < 1000:
-                rpm_values.append(sample.values["RPM"])
-
-        if rpm_values and len(rpm_values) > 5:
-            if statistics.stdev(rpm_values) > 50:
-                symptoms["rough_idle"] = True
-
-        # Check for lean/rich from fuel trims
-        long_trim = [s.values.get("LONG_FUEL_TRIM_1", 0) for s in session.pid_samples]
-        if long_trim:
-            avg_trim = statistics.mean(long_trim)
+        rpm = values.get("RPM", NO_VALUES)
+        idle_rpm = rpm[rpm < 1000]
+
+        if idle_rpm.size > 5 and idle_rpm.std(ddof=1) > 50:
+            symptoms["rough_idle"] = True
+
+        # Check for lean/rich from fuel trims, counting missing readings as 0
+        if stats.sample_count:
+            avg_trim = stats.long_trim_sum / stats.sample_count
             if avg_trim > 10:
                 symptoms["lean_running"] = True
             elif avg_trim < -10:
                 symptoms["rich_running"] = True
 
         # Check for overheating
-        coolant = [s.values.get("COOLANT_TEMP", 0) for s in session.pid_samples]
-        if coolant and max(coolant) > 105:
+        if stats.coolant_max > 105:
             symptoms["overheating"] = True
 
         # Correlate symptoms to likely causes
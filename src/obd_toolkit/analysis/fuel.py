@@ -1,15 +1,18 @@
 """Fuel economy analyzer."""
 
 from typing import List, Tuple
-import statistics
 
-from .base import BaseAnalyzer
+import numpy as np
+
+from .base import BaseAnalyzer, NO_VALUES
 from ..models.session import DiagnosticSession, AnalysisResult, AnalysisFinding
 
 
 class FuelEconomyAnalyzer(BaseAnalyzer):
     """Analyzes fuel economy patterns and efficiency."""
 
+    REQUIRED_PIDS = frozenset({"MAF", "SPEED", "RPM", "ENGINE_LOAD"})
+
     @property
     def name(self) -> str:
         return "Fuel Economy Analysis"
@@ -18,9 +21,6 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
     def description(self) -> str:
         return "Analyzes fuel consumption patterns and identifies inefficiencies"
 
-    def get_required_pids(self) -> List[str]:
-        return ["MAF", "SPEED", "RPM", "ENGINE_LOAD"]
-
     def analyze(self, session: DiagnosticSession) -> AnalysisResult:
         """Analyze fuel economy data."""
         findings = []
@@ -36,49 +36,42 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
                 summary="Insufficient data for fuel analysis"
             )
 
-        # Extract time series data
-        maf_values = []
-        speed_values = []
-        rpm_values = []
-        load_values = []
-
-        for sample in session.pid_samples:
-            if "MAF" in sample.values:
-                maf_values.append(sample.values["MAF"])
-            if "SPEED" in sample.values:
-                speed_values.append(sample.values["SPEED"])
-            if "RPM" in sample.values:
-                rpm_values.append(sample.values["RPM"])
-            if "ENGINE_LOAD" in sample.values:
-                load_values.append(sample.values["ENGINE_LOAD"])
+        # Extract time series data from the session's columnar view
+        arrays = session.get_pid_arrays()
+        maf_values = arrays.get("MAF", NO_VALUES)
+        speed_values = arrays.get("SPEED", NO_VALUES)
+        rpm_values = arrays.get("RPM", NO_VALUES)
+
+        # Samples taken at idle, shared by the idle checks below
+        idle_mask = rpm_values < 1000
 
         # Calculate fuel economy if we have MAF and speed
-        if maf_values and speed_values:
+        if maf_values.size and speed_values.size:
             mpg_samples = self._calculate_mpg_series(maf_values, speed_values)
 
-            if mpg_samples:
-                metrics["average_mpg"] = statistics.mean(mpg_samples)
-                metrics["max_mpg"] = max(mpg_samples)
-                metrics["min_mpg"] = min(mpg_samples)
+            if mpg_samples.size:
+                metrics["average_mpg"] = float(mpg_samples.mean())
+                metrics["max_mpg"] = float(mpg_samples.max())
+                metrics["min_mpg"] = float(mpg_samples.min())
 
                 # Analyze fuel economy patterns
                 findings.extend(self._analyze_mpg_patterns(mpg_samples, speed_values))
 
         # Analyze fuel consumption patterns
-        if maf_values:
-            metrics["avg_maf"] = statistics.mean(maf_values)
-            findings.extend(self._analyze_maf_patterns(maf_values, rpm_values))
+        if maf_values.size:
+            metrics["avg_maf"] = float(maf_values.mean())
+            findings.extend(self._analyze_maf_patterns(maf_values, idle_mask))
 
         # Analyze idle fuel consumption
-        if maf_values and rpm_values:
-            findings.extend(self._analyze_idle_fuel(maf_values, rpm_values))
+        if maf_values.size and rpm_values.size:
+            findings.extend(self._analyze_idle_fuel(maf_values, idle_mask))
 
         # Analyze driving patterns for efficiency
-        if speed_values and rpm_values:
+        if speed_values.size and rpm_values.size:
             findings.extend(self._analyze_driving_efficiency(speed_values, rpm_values))
 
         # Analyze acceleration patterns
-        if speed_values:
+        if speed_values.size:
             findings.extend(self._analyze_acceleration(speed_values))
 
         # Generate summary
@@ -97,37 +90,30 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
 
     def _calculate_mpg_series(
         self,
-        maf_values: List[float],
-        speed_values: List[float]
-    ) -> List[float]:
+        maf_values: np.ndarray,
+        speed_values: np.ndarray
+    ) -> np.ndarray:
         """Calculate MPG for each sample."""
-        mpg_values = []
-
         min_len = min(len(maf_values), len(speed_values))
+        maf = np.asarray(maf_values, dtype=np.float64)[:min_len]
+        speed = np.asarray(speed_values, dtype=np.float64)[:min_len]
 
-        for i in range(min_len):
-            maf = maf_values[i]
-            speed = speed_values[i]
+        # Skip if stationary or no airflow
+        moving = (speed >= 5) & (maf >= 0.5)
+        maf = maf[moving]
+        speed = speed[moving]
 
-            # Skip if stationary or no airflow
-            if speed < 5 or maf < 0.5:
-                continue
+        # MPG calculation: (speed * 7.718) / MAF
+        # This assumes gasoline with AFR of 14.7
+        mpg = speed * 0.621371 * 7.718 / maf  # Convert km/h to mph first
 
-            # MPG calculation: (speed * 7.718) / MAF
-            # This assumes gasoline with AFR of 14.7
-            mpg = (speed * 7.718) / maf
-            mpg = speed * 0.621371 * 7.718 / maf  # Convert km/h to mph first
-
-            # Sanity check - ignore unrealistic values
-            if 1 < mpg < 100:
-                mpg_values.append(mpg)
-
-        return mpg_values
+        # Sanity check - ignore unrealistic values
+        return mpg[(mpg > 1) & (mpg < 100)]
 
     def _analyze_mpg_patterns(
         self,
-        mpg_values: List[float],
-        speed_values: List[float]
+        mpg_values: np.ndarray,
+        speed_values: np.ndarray
     ) -> List[AnalysisFinding]:
         """Analyze MPG patterns."""
         findings = []
@@ -135,8 +121,8 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
         if len(mpg_values) < 5:
             return findings
 
-        avg_mpg = statistics.mean(mpg_values)
-        std_mpg = statistics.stdev(mpg_values) if len(mpg_values) > 1 else 0
+        avg_mpg = float(mpg_values.mean())
+        std_mpg = float(mpg_values.std(ddof=1))
 
         # Check for poor fuel economy
         if avg_mpg < 15:
@@ -173,8 +159,8 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
 
     def _analyze_maf_patterns(
         self,
-        maf_values: List[float],
-        rpm_values: List[float]
+        maf_values: np.ndarray,
+        idle_mask: np.ndarray
     ) -> List[AnalysisFinding]:
         """Analyze MAF patterns for issues."""
         findings = []
@@ -182,8 +168,7 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
         if len(maf_values) < 5:
             return findings
 
-        avg_maf = statistics.mean(maf_values)
-        max_maf = max(maf_values)
+        max_maf = float(maf_values.max())
 
         # Check for unusually high airflow
         if max_maf > 200:
@@ -197,14 +182,15 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
             ))
 
         # Check MAF vs RPM correlation if we have RPM data
-        if rpm_values and len(rpm_values) == len(maf_values):
+        if idle_mask.size and len(idle_mask) == len(maf_values):
             # At idle (low RPM), MAF should be low
-            idle_maf = [maf_values[i] for i in range(len(rpm_values)) if rpm_values[i] < 1000]
+            idle_maf = maf_values[idle_mask]
+            avg_idle_maf = float(idle_maf.mean()) if idle_maf.size else 0.0
 
-            if idle_maf and statistics.mean(idle_maf) > 10:
+            if avg_idle_maf > 10:
                 findings.append(self.create_finding(
                     "High Idle Airflow",
-                    f"MAF at idle is higher than expected ({statistics.mean(idle_maf):.1f} g/s). "
+                    f"MAF at idle is higher than expected ({avg_idle_maf:.1f} g/s). "
                     "This may indicate a vacuum leak or MAF sensor issue.",
                     severity="warning",
                     category="fuel",
@@ -221,22 +207,20 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
 
     def _analyze_idle_fuel(
         self,
-        maf_values: List[float],
-        rpm_values: List[float]
+        maf_values: np.ndarray,
+        idle_mask: np.ndarray
     ) -> List[AnalysisFinding]:
         """Analyze fuel consumption at idle."""
         findings = []
 
         # Find idle periods
-        idle_maf = []
-        for i in range(len(rpm_values)):
-            if i < len(maf_values) and rpm_values[i] < 1000:
-                idle_maf.append(maf_values[i])
+        min_len = min(len(maf_values), len(idle_mask))
+        idle_maf = maf_values[:min_len][idle_mask[:min_len]]
 
-        if len(idle_maf) < 3:
+        if idle_maf.size < 3:
             return findings
 
-        avg_idle_maf = statistics.mean(idle_maf)
+        avg_idle_maf = float(idle_maf.mean())
 
         # Estimate idle fuel consumption (L/h)
         # Assuming gasoline: fuel_rate = MAF / (AFR * density) = MAF / (14.7 * 750) * 3600
@@ -262,8 +246,8 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
 
     def _analyze_driving_efficiency(
         self,
-        speed_values: List[float],
-        rpm_values: List[float]
+        speed_values: np.ndarray,
+        rpm_values: np.ndarray
     ) -> List[AnalysisFinding]:
         """Analyze driving efficiency based on speed/RPM relationship."""
         findings = []
@@ -273,17 +257,17 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
 
         # Calculate speed/RPM ratio (gear indicator)
         min_len = min(len(speed_values), len(rpm_values))
-        ratios = []
-
-        for i in range(min_len):
-            if rpm_values[i] > 500 and speed_values[i] > 20:
-                ratio = speed_values[i] / rpm_values[i] * 1000
-                ratios.append(ratio)
+        speed = speed_values[:min_len]
+        rpm = rpm_values[:min_len]
 
-        if not ratios:
+        # Only moving, running samples say anything about gearing; the
+        # RPM floor also keeps the division away from zero
+        driving = (rpm > 500) & (speed > 20)
+        if not driving.any():
             return findings
 
-        avg_ratio = statistics.mean(ratios)
+        ratios = speed[driving] / rpm[driving] * 1000
+        avg_ratio = float(ratios.mean())
 
         # Low ratio means high RPM for speed (possibly wrong gear)
         if avg_ratio < 20:
@@ -304,7 +288,7 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _analyze_acceleration(self, speed_values: List[float]) -> List[AnalysisFinding]:
+    def _analyze_acceleration(self, speed_values: np.ndarray) -> List[AnalysisFinding]:
         """Analyze acceleration patterns."""
         findings = []
 
@@ -312,21 +296,15 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
             return findings
 
         # Calculate acceleration between samples
-        accelerations = []
-        for i in range(1, len(speed_values)):
-            accel = speed_values[i] - speed_values[i-1]
-            accelerations.append(accel)
-
-        if not accelerations:
-            return findings
+        accelerations = np.diff(speed_values)
 
         # Count aggressive accelerations (>10 km/h change per sample)
-        aggressive_accels = [a for a in accelerations if a > 10]
+        aggressive_count = int(np.count_nonzero(accelerations > 10))
 
-        if len(aggressive_accels) > len(accelerations) * 0.2:  # More than 20% aggressive
+        if aggressive_count > len(accelerations) * 0.2:  # More than 20% aggressive
             findings.append(self.create_finding(
                 "Aggressive Acceleration Pattern",
-                f"Detected frequent rapid acceleration ({len(aggressive_accels)} instances). "
+                f"Detected frequent rapid acceleration ({aggressive_count} instances). "
                 "This significantly impacts fuel economy.",
                 severity="info",
                 category="driving",
@@ -340,7 +318,7 @@ class FuelEconomyAnalyzer(BaseAnalyzer):
             ))
 
         # Check for excessive idling (speed near 0 for long periods)
-        idle_count = sum(1 for s in speed_values if s < 5)
+        idle_count = int(np.count_nonzero(speed_values < 5))
         if idle_count > len(speed_values) * 0.3:  # More than 30% idle
             findings.append(self.create_finding(
                 "Excessive Idling Detected",
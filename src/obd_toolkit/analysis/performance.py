@@ -1,15 +1,23 @@
 """Performance analyzer for engine and vehicle performance."""
 
+from collections import Counter
 from typing import List
-import statistics
 
-from .base import BaseAnalyzer
+import numpy as np
+
+from .base import BaseAnalyzer, NO_VALUES
 from ..models.session import DiagnosticSession, AnalysisResult, AnalysisFinding
 
 
+# P0300 (random) and P0301-P0309 (per cylinder)
+_MISFIRE_PREFIX = "P030"
+
+
 class PerformanceAnalyzer(BaseAnalyzer):
     """Analyzes vehicle performance data."""
 
+    REQUIRED_PIDS = frozenset({"RPM", "ENGINE_LOAD", "THROTTLE_POS", "COOLANT_TEMP"})
+
     @property
     def name(self) -> str:
         return "Performance Analysis"
@@ -18,9 +26,6 @@ class PerformanceAnalyzer(BaseAnalyzer):
     def description(self) -> str:
         return "Analyzes engine performance, detects misfires and sensor issues"
 
-    def get_required_pids(self) -> List[str]:
-        return ["RPM", "ENGINE_LOAD", "THROTTLE_POS", "COOLANT_TEMP"]
-
     def analyze(self, session: DiagnosticSession) -> AnalysisResult:
         """Analyze performance data."""
         findings = []
@@ -36,51 +41,56 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 summary="Insufficient data for performance analysis"
             )
 
-        # Extract time series data
-        rpm_values = []
-        load_values = []
-        throttle_values = []
-        coolant_values = []
-
-        for sample in session.pid_samples:
-            if "RPM" in sample.values:
-                rpm_values.append(sample.values["RPM"])
-            if "ENGINE_LOAD" in sample.values:
-                load_values.append(sample.values["ENGINE_LOAD"])
-            if "THROTTLE_POS" in sample.values:
-                throttle_values.append(sample.values["THROTTLE_POS"])
-            if "COOLANT_TEMP" in sample.values:
-                coolant_values.append(sample.values["COOLANT_TEMP"])
+        # Extract time series data from the session's columnar view, unless
+        # none of the performance PIDs were logged (DTCs are still checked)
+        if self.has_required_data(session):
+            arrays = session.get_pid_arrays()
+        else:
+            arrays = {}
+            findings.append(self.create_finding(
+                "No Relevant PIDs",
+                "None of the PIDs used for performance analysis "
+                f"({', '.join(sorted(self.REQUIRED_PIDS))}) were recorded",
+                severity="info"
+            ))
+
+        rpm_values = arrays.get("RPM", NO_VALUES)
+        load_values = arrays.get("ENGINE_LOAD", NO_VALUES)
+        throttle_values = arrays.get("THROTTLE_POS", NO_VALUES)
+        coolant_values = arrays.get("COOLANT_TEMP", NO_VALUES)
 
         # Analyze RPM stability (misfire detection)
-        if rpm_values:
+        if rpm_values.size:
             findings.extend(self._analyze_rpm_stability(rpm_values))
-            metrics["rpm_avg"] = statistics.mean(rpm_values)
-            metrics["rpm_max"] = max(rpm_values)
-            metrics["rpm_std"] = statistics.stdev(rpm_values) if len(rpm_values) > 1 else 0
+            metrics["rpm_avg"] = float(rpm_values.mean())
+            metrics["rpm_max"] = float(rpm_values.max())
+            metrics["rpm_std"] = float(rpm_values.std(ddof=1)) if rpm_values.size > 1 else 0
 
         # Analyze engine load patterns
-        if load_values:
+        if load_values.size:
             findings.extend(self._analyze_load_patterns(load_values))
-            metrics["load_avg"] = statistics.mean(load_values)
-            metrics["load_max"] = max(load_values)
+            metrics["load_avg"] = float(load_values.mean())
+            metrics["load_max"] = float(load_values.max())
 
         # Analyze throttle response
-        if throttle_values and rpm_values:
+        if throttle_values.size and rpm_values.size:
             findings.extend(self._analyze_throttle_response(throttle_values, rpm_values))
 
         # Analyze coolant temperature
-        if coolant_values:
-            findings.extend(self._analyze_coolant_temp(coolant_values))
-            metrics["coolant_avg"] = statistics.mean(coolant_values)
-            metrics["coolant_max"] = max(coolant_values)
+        if coolant_values.size:
+            max_temp = float(coolant_values.max())
+            avg_temp = float(coolant_values.mean())
+            findings.extend(self._analyze_coolant_temp(coolant_values, max_temp, avg_temp))
+            metrics["coolant_avg"] = avg_temp
+            metrics["coolant_max"] = max_temp
 
         # Check DTCs for performance-related codes
         if session.dtc_result:
             findings.extend(self._analyze_performance_dtcs(session.dtc_result))
 
         # Generate summary
-        issue_count = sum(1 for f in findings if f.severity in ("critical", "warning"))
+        severity_counts = Counter(f.severity for f in findings)
+        issue_count = severity_counts["critical"] + severity_counts["warning"]
         if issue_count == 0:
             summary = "No performance issues detected. Engine appears to be running normally."
         elif issue_count == 1:
@@ -90,25 +100,20 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
         return self.create_result(findings=findings, summary=summary, metrics=metrics)
 
-    def _analyze_rpm_stability(self, rpm_values: List[float]) -> List[AnalysisFinding]:
+    def _analyze_rpm_stability(self, rpm_values: np.ndarray) -> List[AnalysisFinding]:
         """Analyze RPM for stability issues (potential misfires)."""
         findings = []
 
         if len(rpm_values) < 5:
             return findings
 
-        # Calculate RPM variance
-        mean_rpm = statistics.mean(rpm_values)
-        std_rpm = statistics.stdev(rpm_values)
-
         # Calculate RPM changes between samples
-        rpm_changes = [abs(rpm_values[i] - rpm_values[i-1]) for i in range(1, len(rpm_values))]
-        max_change = max(rpm_changes) if rpm_changes else 0
+        rpm_changes = np.abs(np.diff(rpm_values))
 
         # Check for high variance at idle
-        idle_samples = [r for r in rpm_values if r < 1200]
-        if idle_samples and len(idle_samples) > 3:
-            idle_std = statistics.stdev(idle_samples)
+        idle_samples = rpm_values[rpm_values < 1200]
+        if idle_samples.size > 3:
+            idle_std = float(idle_samples.std(ddof=1))
 
             if idle_std > 100:
                 findings.append(self.create_finding(
@@ -128,11 +133,11 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 ))
 
         # Check for sudden RPM drops (potential misfire)
-        large_drops = [c for c in rpm_changes if c > 300]
-        if len(large_drops) > 2:
+        large_drops = int(np.count_nonzero(rpm_changes > 300))
+        if large_drops > 2:
             findings.append(self.create_finding(
                 "RPM Fluctuations Detected",
-                f"Detected {len(large_drops)} significant RPM drops (>300 RPM). "
+                f"Detected {large_drops} significant RPM drops (>300 RPM). "
                 "This pattern may indicate cylinder misfires.",
                 severity="warning",
                 category="engine",
@@ -148,18 +153,17 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _analyze_load_patterns(self, load_values: List[float]) -> List[AnalysisFinding]:
+    def _analyze_load_patterns(self, load_values: np.ndarray) -> List[AnalysisFinding]:
         """Analyze engine load patterns."""
         findings = []
 
         if len(load_values) < 5:
             return findings
 
-        avg_load = statistics.mean(load_values)
-        max_load = max(load_values)
+        avg_load = float(load_values.mean())
 
         # Check for consistently high load at idle
-        if avg_load > 40 and max(load_values) == min(load_values):
+        if avg_load > 40 and np.ptp(load_values) == 0:
             findings.append(self.create_finding(
                 "High Idle Load",
                 f"Engine load is consistently high ({avg_load:.0f}%) even at idle. "
@@ -176,13 +180,13 @@ class PerformanceAnalyzer(BaseAnalyzer):
             ))
 
         # Check for load spikes
-        load_changes = [abs(load_values[i] - load_values[i-1]) for i in range(1, len(load_values))]
-        sudden_spikes = [c for c in load_changes if c > 30]
+        load_changes = np.abs(np.diff(load_values))
+        sudden_spikes = int(np.count_nonzero(load_changes > 30))
 
-        if len(sudden_spikes) > 3:
+        if sudden_spikes > 3:
             findings.append(self.create_finding(
                 "Load Fluctuations",
-                f"Detected {len(sudden_spikes)} sudden load changes (>30%). "
+                f"Detected {sudden_spikes} sudden load changes (>30%). "
                 "This could indicate transmission issues or engine hesitation.",
                 severity="info",
                 category="engine",
@@ -194,8 +198,8 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
     def _analyze_throttle_response(
         self,
-        throttle_values: List[float],
-        rpm_values: List[float]
+        throttle_values: np.ndarray,
+        rpm_values: np.ndarray
     ) -> List[AnalysisFinding]:
         """Analyze throttle response correlation with RPM."""
         findings = []
@@ -206,19 +210,13 @@ class PerformanceAnalyzer(BaseAnalyzer):
         # Check throttle-RPM correlation
         # When throttle increases, RPM should increase (with some delay)
 
-        # Find throttle increases
-        throttle_increases = []
-        for i in range(1, len(throttle_values)):
-            if throttle_values[i] - throttle_values[i-1] > 10:
-                throttle_increases.append(i)
+        # Find throttle increases (index of the sample after the jump)
+        throttle_increases = np.flatnonzero(np.diff(throttle_values) > 10) + 1
 
         # Check if RPM follows throttle
-        slow_responses = 0
-        for idx in throttle_increases:
-            if idx + 3 < len(rpm_values):
-                rpm_increase = rpm_values[idx + 2] - rpm_values[idx]
-                if rpm_increase < 100:  # RPM didn't respond
-                    slow_responses += 1
+        throttle_increases = throttle_increases[throttle_increases + 3 < len(rpm_values)]
+        rpm_increase = rpm_values[throttle_increases + 2] - rpm_values[throttle_increases]
+        slow_responses = int(np.count_nonzero(rpm_increase < 100))  # RPM didn't respond
 
         if slow_responses > 2:
             findings.append(self.create_finding(
@@ -239,17 +237,18 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _analyze_coolant_temp(self, coolant_values: List[float]) -> List[AnalysisFinding]:
-        """Analyze coolant temperature patterns."""
+    def _analyze_coolant_temp(
+        self,
+        coolant_values: np.ndarray,
+        max_temp: float,
+        avg_temp: float
+    ) -> List[AnalysisFinding]:
+        """Analyze coolant temperature patterns from precomputed max and mean."""
         findings = []
 
-        if not coolant_values:
+        if not coolant_values.size:
             return findings
 
-        max_temp = max(coolant_values)
-        min_temp = min(coolant_values)
-        avg_temp = statistics.mean(coolant_values)
-
         # Check for overheating
         if max_temp > 110:
             findings.append(self.create_finding(
@@ -300,11 +299,11 @@ class PerformanceAnalyzer(BaseAnalyzer):
         """Analyze DTCs for performance-related codes."""
         findings = []
 
-        all_codes = dtc_result.all_codes if hasattr(dtc_result, 'all_codes') else []
+        all_codes = dtc_result.all_codes
 
-        misfire_codes = [c for c in all_codes if c.code.startswith("P030")]
+        misfire_codes = [c.code for c in all_codes if c.code.startswith(_MISFIRE_PREFIX)]
         if misfire_codes:
-            codes_str = ", ".join(c.code for c in misfire_codes)
+            codes_str = ", ".join(misfire_codes)
             findings.append(self.create_finding(
                 "Misfire Codes Present",
                 f"Active misfire codes detected: {codes_str}",
@@ -316,7 +315,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
                     "Check ignition system",
                     "Inspect fuel injectors",
                 ],
-                related_dtcs=[c.code for c in misfire_codes],
+                related_dtcs=misfire_codes,
             ))
 
         return findings
@@ -1,26 +1,21 @@
 """OBD Toolkit CLI application."""
 
 import sys
-from typing import Optional, List
+from functools import lru_cache, wraps
+from typing import Optional, List, TYPE_CHECKING
 from pathlib import Path
 
 import typer
 from rich.console import Console
 
-from .connection.manager import ConnectionManager, get_connection_manager, ConnectionState
-from .connection.adapter import AdapterDetector
-from .collectors.dtc import DTCCollector
-from .collectors.pid import PIDCollector
-from .collectors.vin import VINCollector
-from .collectors.live import LiveDataCollector
-from .decoders.dtc import DTCDecoder
-from .decoders.vin import VINDecoder
 from .display.console import console as display_console
-from .display.tables import TableDisplay
-from .display.live import LiveDisplay
-from .models.pid import PID_PRESETS
-from .storage.logger import SessionLogger
-from .storage.history import HistoryManager
+
+# Connection, collector, decoder and storage modules pull in python-OBD and
+# friends, so commands import them on first use to keep --help fast
+if TYPE_CHECKING:
+    from .connection.manager import ConnectionManager
+    from .display.tables import TableDisplay
+    from .models.session import DiagnosticSession
 
 
 # Create Typer apps
@@ -42,21 +37,27 @@ app.add_typer(log_app, name="log")
 app.add_typer(history_app, name="history")
 app.add_typer(analyze_app, name="analyze")
 
-# Global state
-_connection_manager: Optional[ConnectionManager] = None
-_table_display = TableDisplay(Console())
+# Minimum seconds between redraws of a "\r" progress line
+_PROGRESS_INTERVAL = 0.1
 
 
-def get_manager() -> ConnectionManager:
+@lru_cache(maxsize=1)
+def get_manager() -> "ConnectionManager":
     """Get or create connection manager."""
-    global _connection_manager
-    if _connection_manager is None:
-        _connection_manager = ConnectionManager()
-    return _connection_manager
+    from .connection.manager import ConnectionManager
+    return ConnectionManager()
+
+
+@lru_cache(maxsize=1)
+def _get_table_display() -> "TableDisplay":
+    """Get the shared table display, created on first use."""
+    from .display.tables import TableDisplay
+    return TableDisplay(Console())
 
 
 def require_connection(func):
     """Decorator to ensure connection before running command."""
+    @wraps(func)
     def wrapper(*args, **kwargs):
         manager = get_manager()
         if not manager.is_car_connected:
@@ -66,24 +67,51 @@ def require_connection(func):
     return wrapper
 
 
+def _resolve_pids(pids: Optional[str], preset: Optional[str], default_preset: str) -> List[str]:
+    """
+    Work out which PIDs a command should use.
+
+    Args:
+        pids: Comma-separated PID names given on the command line
+        preset: Name of a PID preset, used when no PIDs were given
+        default_preset: Preset used when neither is given (or the preset is unknown)
+
+    Returns:
+        New list of PID names
+    """
+    if pids:
+        return [p.strip().upper() for p in pids.split(",")]
+
+    from .models.pid import PID_PRESETS
+    return list(PID_PRESETS.get(preset) or PID_PRESETS[default_preset])
+
+
 # ============ Main Commands ============
 
 @app.command()
 def connect(
-    port: Optional[str] = typer.Option(None, "--port", "-p", help="Serial port (auto-detect if not specified)"),
-    baudrate: int = typer.Option(38400, "--baudrate", "-b", help="Baud rate"),
+    port: Optional[str] = typer.Option(
+        None, "--port", "-p", envvar="OBD_PORT", help="Serial port (auto-detect if not specified)"
+    ),
+    baudrate: int = typer.Option(38400, "--baudrate", "-b", envvar="OBD_BAUDRATE", help="Baud rate"),
     protocol: Optional[str] = typer.Option(None, "--protocol", help="Force OBD protocol"),
     timeout: float = typer.Option(3.0, "--timeout", "-t", help="Connection timeout in seconds"),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Rescan ports instead of reusing a recent scan"
+    ),
 ):
     """Connect to an OBD2 adapter."""
+    from .connection.adapter import AdapterDetector
+    from .connection.manager import ConnectionState
+
+    tables = _get_table_display()
     display_console.print_banner()
 
     manager = get_manager()
-    live_display = LiveDisplay()
 
     if port is None:
         display_console.info("Scanning for OBD2 adapters...")
-        adapters = AdapterDetector.detect_all()
+        adapters = AdapterDetector.detect_all(refresh=refresh)
 
         if not adapters:
             display_console.error("No OBD2 adapters found.")
@@ -95,7 +123,7 @@ def connect(
             {"port": a.port, "type": a.adapter_type.value, "description": a.description, "manufacturer": a.manufacturer}
             for a in adapters
         ]
-        _table_display.show(_table_display.adapters_table(adapter_data))
+        tables.show(tables.adapters_table(adapter_data))
 
         port = adapters[0].port
         display_console.info(f"Using {port}")
@@ -143,8 +171,7 @@ def status():
         # Try to get VIN if connected to car
         if manager.is_car_connected:
             try:
-                vin_collector = VINCollector(manager)
-                vin = vin_collector.read_vin()
+                vin = manager.read_vin()
                 if vin:
                     display_console.print(f"  VIN: {vin}")
             except:
@@ -157,9 +184,14 @@ def status():
 @app.command()
 def scan():
     """Scan for available OBD2 adapters."""
+    from .connection.adapter import AdapterDetector
+
+    tables = _get_table_display()
     display_console.header("Scanning for OBD2 Adapters")
 
-    adapters = AdapterDetector.detect_all()
+    # An explicit scan always lists the ports again, e.g. right after an
+    # adapter is plugged in while the repl is running
+    adapters = AdapterDetector.detect_all(refresh=True)
 
     if not adapters:
         display_console.warning("No OBD2 adapters found")
@@ -170,34 +202,32 @@ def scan():
         {"port": a.port, "type": a.adapter_type.value, "description": a.description, "manufacturer": a.manufacturer}
         for a in adapters
     ]
-    _table_display.show(_table_display.adapters_table(adapter_data))
+    tables.show(tables.adapters_table(adapter_data))
 
     display_console.info(f"Found {len(adapters)} adapter(s)")
 
 
 @app.command()
+@require_connection
 def vin(
     online: bool = typer.Option(False, "--online", "-o", help="Use NHTSA API for detailed info"),
 ):
     """Read and decode Vehicle Identification Number."""
+    tables = _get_table_display()
     manager = get_manager()
 
-    if not manager.is_car_connected:
-        display_console.error("Not connected to vehicle")
-        raise typer.Exit(1)
-
     display_console.header("Vehicle Information")
 
-    collector = VINCollector(manager)
-    info = collector.get_vehicle_info(use_online=online)
+    info = manager.get_vehicle_info(use_online=online)
 
     if info:
-        _table_display.show(_table_display.vehicle_info_table(info))
+        tables.show(tables.vehicle_info_table(info))
     else:
         display_console.error("Could not read VIN from vehicle")
 
 
 @app.command()
+@require_connection
 def monitor(
     pids: Optional[str] = typer.Option(None, "--pids", "-p", help="Comma-separated PIDs to monitor"),
     preset: Optional[str] = typer.Option(None, "--preset", help="PID preset (engine, fuel, performance, economy, all)"),
@@ -205,19 +235,13 @@ def monitor(
     no_gauges: bool = typer.Option(False, "--no-gauges", help="Disable gauge display"),
 ):
     """Live monitoring dashboard."""
-    manager = get_manager()
+    from .collectors.live import LiveDataCollector
+    from .display.live import LiveDisplay
 
-    if not manager.is_car_connected:
-        display_console.error("Not connected to vehicle")
-        raise typer.Exit(1)
+    manager = get_manager()
 
     # Determine which PIDs to monitor
-    if pids:
-        pid_list = [p.strip().upper() for p in pids.split(",")]
-    elif preset and preset in PID_PRESETS:
-        pid_list = PID_PRESETS[preset]
-    else:
-        pid_list = PID_PRESETS["engine"]  # Default preset
+    pid_list = _resolve_pids(pids, preset, "engine")
 
     display_console.info(f"Starting monitor with PIDs: {', '.join(pid_list)}")
     display_console.info("Press Ctrl+C to stop\n")
@@ -227,12 +251,15 @@ def monitor(
 
     # Get vehicle info for header
     try:
-        vin_collector = VINCollector(manager)
-        vehicle = vin_collector.get_vehicle_info()
+        vehicle = manager.get_vehicle_info()
         vehicle_str = f"{vehicle.manufacturer} {vehicle.model_year}" if vehicle else None
     except:
         vehicle_str = None
 
+    # Poll on the collector's thread so redraws never wait on the adapter
+    collector.start_streaming()
+    collector.wait_for_samples(timeout=2.0)
+
     try:
         live_display.start_monitoring(
             get_values=collector.get_latest,
@@ -243,6 +270,8 @@ def monitor(
         )
     except KeyboardInterrupt:
         pass
+    finally:
+        collector.stop_streaming()
 
     display_console.newline()
     display_console.info("Monitoring stopped")
@@ -251,17 +280,17 @@ def monitor(
 # ============ DTC Commands ============
 
 @dtc_app.command("read")
+@require_connection
 def dtc_read(
     stored: bool = typer.Option(True, "--stored/--no-stored", help="Read stored codes"),
     pending: bool = typer.Option(True, "--pending/--no-pending", help="Read pending codes"),
     permanent: bool = typer.Option(True, "--permanent/--no-permanent", help="Read permanent codes"),
 ):
     """Read diagnostic trouble codes."""
-    manager = get_manager()
+    from .collectors.dtc import DTCCollector
 
-    if not manager.is_car_connected:
-        display_console.error("Not connected to vehicle")
-        raise typer.Exit(1)
+    tables = _get_table_display()
+    manager = get_manager()
 
     display_console.header("Diagnostic Trouble Codes")
 
@@ -269,37 +298,36 @@ def dtc_read(
     result = collector.collect()
 
     # Show summary
-    _table_display.show(_table_display.dtc_summary_table(result))
+    tables.show(tables.dtc_summary_table(result))
 
     # Show stored codes
     if stored and result.stored_codes:
         display_console.subheader("Stored Codes")
-        _table_display.show(_table_display.dtc_table(result.stored_codes, "Stored DTCs"))
+        tables.show(tables.dtc_table(result.stored_codes, "Stored DTCs"))
 
     # Show pending codes
     if pending and result.pending_codes:
         display_console.subheader("Pending Codes")
-        _table_display.show(_table_display.dtc_table(result.pending_codes, "Pending DTCs"))
+        tables.show(tables.dtc_table(result.pending_codes, "Pending DTCs"))
 
     # Show permanent codes
     if permanent and result.permanent_codes:
         display_console.subheader("Permanent Codes")
-        _table_display.show(_table_display.dtc_table(result.permanent_codes, "Permanent DTCs"))
+        tables.show(tables.dtc_table(result.permanent_codes, "Permanent DTCs"))
 
     if result.total_codes == 0:
         display_console.success("No diagnostic trouble codes found!")
 
 
 @dtc_app.command("clear")
+@require_connection
 def dtc_clear(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ):
     """Clear diagnostic trouble codes."""
-    manager = get_manager()
+    from .collectors.dtc import DTCCollector
 
-    if not manager.is_car_connected:
-        display_console.error("Not connected to vehicle")
-        raise typer.Exit(1)
+    manager = get_manager()
 
     if not force:
         display_console.warning("This will clear all DTCs and turn off the check engine light.")
@@ -322,12 +350,15 @@ def dtc_search(
     query: str = typer.Argument(..., help="Search query"),
 ):
     """Search DTC codes by description."""
+    from .decoders.dtc import DTCDecoder
+
+    tables = _get_table_display()
     decoder = DTCDecoder()
     results = decoder.search(query)
 
     if results:
         display_console.header(f"Search Results for '{query}'")
-        _table_display.show(_table_display.dtc_table(results, f"Found {len(results)} codes"))
+        tables.show(tables.dtc_table(results, f"Found {len(results)} codes"))
     else:
         display_console.warning(f"No codes found matching '{query}'")
 
@@ -339,6 +370,9 @@ def pid_list(
     supported_only: bool = typer.Option(False, "--supported", "-s", help="Show only supported PIDs"),
 ):
     """List available PIDs."""
+    from .collectors.pid import PIDCollector
+
+    tables = _get_table_display()
     manager = get_manager()
 
     collector = PIDCollector(manager)
@@ -348,28 +382,34 @@ def pid_list(
         pids = [p for p in pids if p.is_supported]
 
     display_console.header("Available PIDs")
-    _table_display.show(_table_display.pid_info_table(pids))
+    tables.show(tables.pid_info_table(pids))
     display_console.info(f"Total: {len(pids)} PIDs")
 
 
 @pid_app.command("read")
+@require_connection
 def pid_read(
     pid_name: str = typer.Argument(..., help="PID name to read (e.g., RPM, SPEED)"),
     continuous: bool = typer.Option(False, "--continuous", "-c", help="Continuous reading"),
     interval: int = typer.Option(500, "--interval", "-i", help="Interval in ms for continuous mode"),
 ):
     """Read a specific PID value."""
-    manager = get_manager()
+    from .collectors.pid import PIDCollector
 
-    if not manager.is_car_connected:
-        display_console.error("Not connected to vehicle")
-        raise typer.Exit(1)
+    manager = get_manager()
 
     collector = PIDCollector(manager)
     pid_name = pid_name.upper()
 
     if continuous:
+        import time
+
         display_console.info(f"Reading {pid_name} continuously. Press Ctrl+C to stop.\n")
+
+        # Schedule reads against fixed deadlines so the time spent reading
+        # does not stretch the interval
+        period_ns = interval * 1_000_000
+        next_deadline = time.monotonic_ns()
         try:
             while True:
                 value = collector.read_pid(pid_name)
@@ -377,8 +417,15 @@ def pid_read(
                     display_console.print(f"\r{value.name}: {value.formatted_value}    ", end="")
                 else:
                     display_console.print(f"\r{pid_name}: N/A    ", end="")
-                import time
-                time.sleep(interval / 1000)
+
+                next_deadline += period_ns
+                remaining_ns = next_deadline - time.monotonic_ns()
+                if remaining_ns > 0:
+                    time.sleep(remaining_ns / 1e9)
+                else:
+                    # The read overran the interval; start a fresh schedule
+                    # rather than firing a burst of catch-up reads
+                    next_deadline = time.monotonic_ns()
         except KeyboardInterrupt:
             display_console.newline()
     else:
@@ -394,13 +441,16 @@ def pid_search(
     query: str = typer.Argument(..., help="Search query"),
 ):
     """Search PIDs by name or description."""
+    from .collectors.pid import PIDCollector
+
+    tables = _get_table_display()
     manager = get_manager()
     collector = PIDCollector(manager)
     results = collector.search_pids(query)
 
     if results:
         display_console.header(f"PIDs matching '{query}'")
-        _table_display.show(_table_display.pid_info_table(results))
+        tables.show(tables.pid_info_table(results))
     else:
         display_console.warning(f"No PIDs found matching '{query}'")
 
@@ -408,33 +458,37 @@ def pid_search(
 # ============ Log Commands ============
 
 @log_app.command("start")
+@require_connection
 def log_start(
     pids: Optional[str] = typer.Option(None, "--pids", "-p", help="Comma-separated PIDs to log"),
     preset: Optional[str] = typer.Option("performance", "--preset", help="PID preset"),
     format: str = typer.Option("json", "--format", "-f", help="Output format (json, csv)"),
     interval: int = typer.Option(500, "--interval", "-i", help="Logging interval in ms"),
+    buffer_size: int = typer.Option(1000, "--buffer-size", min=1, help="Samples held between writes"),
+    overflow: str = typer.Option(
+        "drop-old", "--overflow", help="When the buffer is full (drop-old, drop-new, block)"
+    ),
 ):
     """Start data logging session."""
+    from .collectors.live import LiveDataCollector, OverflowPolicy
+    from .storage.logger import SessionLogger
+
     manager = get_manager()
 
-    if not manager.is_car_connected:
-        display_console.error("Not connected to vehicle")
+    try:
+        overflow_policy = OverflowPolicy(overflow)
+    except ValueError:
+        display_console.error(f"Unknown overflow policy: {overflow}")
         raise typer.Exit(1)
 
     # Determine PIDs
-    if pids:
-        pid_list = [p.strip().upper() for p in pids.split(",")]
-    elif preset in PID_PRESETS:
-        pid_list = PID_PRESETS[preset]
-    else:
-        pid_list = PID_PRESETS["performance"]
+    pid_list = _resolve_pids(pids, preset, "performance")
 
     logger = SessionLogger(format=format)
 
     # Get vehicle info
     try:
-        vin_collector = VINCollector(manager)
-        vehicle_info = vin_collector.get_vehicle_info()
+        vehicle_info = manager.get_vehicle_info()
     except:
         vehicle_info = None
 
@@ -444,22 +498,35 @@ def log_start(
     display_console.info(f"Logging PIDs: {', '.join(pid_list)}")
     display_console.info("Press Ctrl+C to stop logging\n")
 
-    collector = LiveDataCollector(manager, pids=pid_list, interval_ms=interval)
+    collector = LiveDataCollector(
+        manager,
+        pids=pid_list,
+        interval_ms=interval,
+        buffer_size=buffer_size,
+        overflow=overflow_policy,
+    )
+
+    import time
 
     try:
         collector.start_streaming()
+        last_progress = 0.0
         while True:
-            samples = collector.get_buffered_samples(max_samples=10)
-            for sample in samples:
-                logger.log_sample(sample)
+            # Wake when the collector has buffered samples, or once a second
+            # to keep the progress line current
+            if collector.wait_for_samples(timeout=1.0):
+                logger.log_samples(collector.get_buffered_samples(max_samples=buffer_size))
 
-            import time
-            time.sleep(0.5)
+            # Show progress, redrawing at most every _PROGRESS_INTERVAL seconds
+            now = time.monotonic()
+            if now - last_progress < _PROGRESS_INTERVAL:
+                continue
+            last_progress = now
 
-            # Show progress
             stats = collector.get_statistics()
             display_console.print(
-                f"\rSamples: {stats['sample_count']} | Rate: {stats['samples_per_second']:.1f}/s    ",
+                f"\rSamples: {stats['sample_count']} | Rate: {stats['samples_per_second']:.1f}/s"
+                f" | Dropped: {stats['dropped_samples']}    ",
                 end=""
             )
 
@@ -486,12 +553,15 @@ def history_list(
     limit: int = typer.Option(10, "--limit", "-n", help="Number of sessions to show"),
 ):
     """List logged sessions."""
+    from .storage.history import HistoryManager
+
+    tables = _get_table_display()
     hist_manager = HistoryManager()
     sessions = hist_manager.list_sessions(limit=limit)
 
     if sessions:
         display_console.header("Diagnostic Sessions")
-        _table_display.show(_table_display.session_table(sessions))
+        tables.show(tables.session_table(sessions))
     else:
         display_console.info("No logged sessions found")
 
@@ -501,6 +571,9 @@ def history_show(
     session_id: str = typer.Argument(..., help="Session ID to show"),
 ):
     """Show details of a logged session."""
+    from .storage.history import HistoryManager
+
+    tables = _get_table_display()
     hist_manager = HistoryManager()
     session = hist_manager.load_session(session_id)
 
@@ -511,11 +584,11 @@ def history_show(
 
         if session.vehicle_info:
             display_console.subheader("Vehicle")
-            _table_display.show(_table_display.vehicle_info_table(session.vehicle_info))
+            tables.show(tables.vehicle_info_table(session.vehicle_info))
 
         if session.dtc_result:
             display_console.subheader("DTCs")
-            _table_display.show(_table_display.dtc_summary_table(session.dtc_result))
+            tables.show(tables.dtc_summary_table(session.dtc_result))
     else:
         display_console.error(f"Session not found: {session_id}")
 
@@ -523,10 +596,12 @@ def history_show(
 @history_app.command("export")
 def history_export(
     session_id: str = typer.Argument(..., help="Session ID to export"),
-    format: str = typer.Option("csv", "--format", "-f", help="Export format (csv, json)"),
+    format: str = typer.Option("csv", "--format", "-f", help="Export format (csv, json, npz)"),
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
 ):
     """Export a session to file."""
+    from .storage.history import HistoryManager
+
     hist_manager = HistoryManager()
 
     filepath = hist_manager.export_session(session_id, format=format, output_path=output)
@@ -539,48 +614,76 @@ def history_export(
 
 # ============ Analyze Commands ============
 
-@analyze_app.command("performance")
-def analyze_performance(
-    file: Optional[str] = typer.Option(None, "--file", "-f", help="Analyze logged session file"),
-):
-    """Analyze performance data."""
+# PIDs streamed by the live fuel analysis and by "analyze all"
+_FUEL_PIDS = ["RPM", "SPEED", "MAF", "ENGINE_LOAD"]
+_ALL_ANALYSIS_PIDS = ["RPM", "SPEED", "COOLANT_TEMP", "ENGINE_LOAD", "THROTTLE_POS", "MAF"]
+
+
+def _load_analysis_session(file: str) -> "DiagnosticSession":
+    """Load a logged session for analysis, exiting if it cannot be read."""
+    from .storage.history import HistoryManager
+
+    hist_manager = HistoryManager()
+    session = hist_manager.load_session_from_file(file)
+    if not session:
+        display_console.error(f"Could not load session from: {file}")
+        raise typer.Exit(1)
+    return session
+
+
+def _collect_analysis_session(
+    message: str,
+    seconds: int,
+    pids: Optional[List[str]] = None,
+    read_dtcs: bool = False,
+) -> "DiagnosticSession":
+    """
+    Stream live data into a new session for analysis.
+
+    Args:
+        message: Progress message shown while collecting
+        seconds: How long to stream for
+        pids: PIDs to stream (None = collector defaults)
+        read_dtcs: Also read DTCs into the session before streaming
+
+    Returns:
+        Session holding the collected data
+    """
     manager = get_manager()
+    if not manager.is_car_connected:
+        display_console.error("Not connected. Use --file to analyze logged data.")
+        raise typer.Exit(1)
 
-    from .analysis.performance import PerformanceAnalyzer
+    import time
+    from .collectors.live import LiveDataCollector
+    from .models.session import DiagnosticSession
 
-    analyzer = PerformanceAnalyzer()
+    session = DiagnosticSession()
 
-    if file:
-        # Analyze from file
-        hist_manager = HistoryManager()
-        session = hist_manager.load_session_from_file(file)
-        if not session:
-            display_console.error(f"Could not load session from: {file}")
-            raise typer.Exit(1)
-    else:
-        # Analyze live data
-        if not manager.is_car_connected:
-            display_console.error("Not connected. Use --file to analyze logged data.")
-            raise typer.Exit(1)
+    if read_dtcs:
+        from .collectors.dtc import DTCCollector
+        dtc_collector = DTCCollector(manager)
+        session.dtc_result = dtc_collector.collect()
 
-        from .models.session import DiagnosticSession
-        collector = LiveDataCollector(manager)
+    collector = LiveDataCollector(manager, pids=pids)
 
-        display_console.info("Collecting data for analysis (10 seconds)...")
-        collector.start_streaming()
+    display_console.info(message)
+    collector.start_streaming()
+    time.sleep(seconds)
+    collector.stop_streaming()
 
-        import time
-        time.sleep(10)
+    session.pid_samples = collector.get_buffered_samples(max_samples=1000)
+    return session
 
-        collector.stop_streaming()
-        samples = collector.get_buffered_samples(max_samples=1000)
 
-        session = DiagnosticSession()
-        session.pid_samples = samples
+def _show_performance(session: "DiagnosticSession") -> None:
+    """Run the performance analyzer on a session and display the result."""
+    from .analysis.performance import PerformanceAnalyzer
 
-    result = analyzer.analyze(session)
+    tables = _get_table_display()
+    result = PerformanceAnalyzer().analyze(session)
     display_console.header("Performance Analysis")
-    _table_display.show(_table_display.analysis_table(result))
+    tables.show(tables.analysis_table(result))
 
     if result.findings:
         display_console.subheader("Recommendations")
@@ -589,96 +692,70 @@ def analyze_performance(
                 display_console.print(f"  - {rec}")
 
 
-@analyze_app.command("fuel")
-def analyze_fuel(
-    file: Optional[str] = typer.Option(None, "--file", "-f", help="Analyze logged session file"),
-):
-    """Analyze fuel economy."""
-    manager = get_manager()
-
+def _show_fuel(session: "DiagnosticSession") -> None:
+    """Run the fuel economy analyzer on a session and display the result."""
     from .analysis.fuel import FuelEconomyAnalyzer
 
-    analyzer = FuelEconomyAnalyzer()
-
-    if file:
-        hist_manager = HistoryManager()
-        session = hist_manager.load_session_from_file(file)
-        if not session:
-            display_console.error(f"Could not load session from: {file}")
-            raise typer.Exit(1)
-    else:
-        if not manager.is_car_connected:
-            display_console.error("Not connected. Use --file to analyze logged data.")
-            raise typer.Exit(1)
-
-        from .models.session import DiagnosticSession
-        collector = LiveDataCollector(manager, pids=["RPM", "SPEED", "MAF", "ENGINE_LOAD"])
-
-        display_console.info("Collecting fuel data (15 seconds)...")
-        collector.start_streaming()
-
-        import time
-        time.sleep(15)
-
-        collector.stop_streaming()
-        samples = collector.get_buffered_samples(max_samples=1000)
-
-        session = DiagnosticSession()
-        session.pid_samples = samples
-
-    result = analyzer.analyze(session)
+    tables = _get_table_display()
+    result = FuelEconomyAnalyzer().analyze(session)
     display_console.header("Fuel Economy Analysis")
-    _table_display.show(_table_display.analysis_table(result))
+    tables.show(tables.analysis_table(result))
 
     if "average_mpg" in result.metrics:
         display_console.print(f"\n  Average MPG: {result.metrics['average_mpg']:.1f}")
 
 
-@analyze_app.command("faults")
-def analyze_faults(
-    file: Optional[str] = typer.Option(None, "--file", "-f", help="Analyze logged session file"),
-):
-    """Detect potential faults."""
-    manager = get_manager()
-
+def _show_faults(session: "DiagnosticSession") -> None:
+    """Run the fault detector on a session and display the result."""
     from .analysis.faults import FaultDetector
 
-    detector = FaultDetector()
+    tables = _get_table_display()
+    result = FaultDetector().analyze(session)
+    display_console.header("Fault Analysis")
+    tables.show(tables.analysis_table(result))
 
+
+@analyze_app.command("performance")
+def analyze_performance(
+    file: Optional[str] = typer.Option(None, "--file", "-f", help="Analyze logged session file"),
+):
+    """Analyze performance data."""
     if file:
-        hist_manager = HistoryManager()
-        session = hist_manager.load_session_from_file(file)
-        if not session:
-            display_console.error(f"Could not load session from: {file}")
-            raise typer.Exit(1)
+        session = _load_analysis_session(file)
     else:
-        if not manager.is_car_connected:
-            display_console.error("Not connected. Use --file to analyze logged data.")
-            raise typer.Exit(1)
+        session = _collect_analysis_session("Collecting data for analysis (10 seconds)...", 10)
 
-        # Collect comprehensive data
-        from .models.session import DiagnosticSession
+    _show_performance(session)
 
-        session = DiagnosticSession()
 
-        # Get DTCs
-        dtc_collector = DTCCollector(manager)
-        session.dtc_result = dtc_collector.collect()
+@analyze_app.command("fuel")
+def analyze_fuel(
+    file: Optional[str] = typer.Option(None, "--file", "-f", help="Analyze logged session file"),
+):
+    """Analyze fuel economy."""
+    if file:
+        session = _load_analysis_session(file)
+    else:
+        session = _collect_analysis_session(
+            "Collecting fuel data (15 seconds)...", 15, pids=_FUEL_PIDS
+        )
 
-        # Get sensor data
-        collector = LiveDataCollector(manager)
-        display_console.info("Collecting sensor data (10 seconds)...")
-        collector.start_streaming()
+    _show_fuel(session)
 
-        import time
-        time.sleep(10)
 
-        collector.stop_streaming()
-        session.pid_samples = collector.get_buffered_samples(max_samples=1000)
+@analyze_app.command("faults")
+def analyze_faults(
+    file: Optional[str] = typer.Option(None, "--file", "-f", help="Analyze logged session file"),
+):
+    """Detect potential faults."""
+    if file:
+        session = _load_analysis_session(file)
+    else:
+        session = _collect_analysis_session(
+            "Collecting sensor data (10 seconds)...", 10, read_dtcs=True
+        )
 
-    result = detector.analyze(session)
-    display_console.header("Fault Analysis")
-    _table_display.show(_table_display.analysis_table(result))
+    _show_faults(session)
 
 
 @analyze_app.command("all")
@@ -687,9 +764,19 @@ def analyze_all(
 ):
     """Run all analyzers."""
     display_console.info("Running all analyzers...")
-    analyze_performance(file)
-    analyze_fuel(file)
-    analyze_faults(file)
+
+    # Load or collect the data once and share it between the analyzers
+    if file:
+        session = _load_analysis_session(file)
+    else:
+        session = _collect_analysis_session(
+            "Collecting data for analysis (15 seconds)...", 15,
+            pids=_ALL_ANALYSIS_PIDS, read_dtcs=True,
+        )
+
+    _show_performance(session)
+    _show_fuel(session)
+    _show_faults(session)
 
 
 # ============ Version Command ============
@@ -701,5 +788,55 @@ def version():
     display_console.print(f"OBD Toolkit v{__version__}")
 
 
+@app.command()
+def repl():
+    """Interactive shell that keeps the connection open between commands."""
+    import shlex
+
+    # Importing readline gives input() line editing and history
+    try:
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+
+    display_console.info("Enter commands without the 'obd-toolkit' prefix, e.g. 'pid read RPM'.")
+    display_console.info("Type 'help' for the command list and 'exit' to quit.\n")
+
+    while True:
+        try:
+            line = input("obd> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            display_console.newline()
+            break
+
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            break
+
+        try:
+            args = ["--help"] if line == "help" else shlex.split(line)
+        except ValueError as e:
+            display_console.error(str(e))
+            continue
+
+        if args[0] == "repl":
+            display_console.warning("Already in the interactive shell")
+            continue
+
+        # Run in-process so the connection manager and loaded modules carry over
+        try:
+            app(args, prog_name="obd-toolkit")
+        except SystemExit:
+            # Typer exits after every command, including --help and usage errors
+            pass
+        except Exception as e:
+            display_console.error(f"Command failed: {e}")
+
+    # Only touch the manager if a command created it
+    if get_manager.cache_info().currsize and get_manager().is_connected:
+        get_manager().disconnect()
+
+
 if __name__ == "__main__":
     app()
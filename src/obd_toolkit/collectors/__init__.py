@@ -4,6 +4,7 @@ from .base import BaseCollector
 from .dtc import DTCCollector
 from .pid import PIDCollector
 from .vin import VINCollector
-from .live import LiveDataCollector
+from .live import LiveDataCollector, OverflowPolicy
 
-__all__ = ["BaseCollector", "DTCCollector", "PIDCollector", "VINCollector", "LiveDataCollector"]
+__all__ = ["BaseCollector", "DTCCollector", "PIDCollector", "VINCollector", "LiveDataCollector",
+           "OverflowPolicy"]
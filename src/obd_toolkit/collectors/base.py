@@ -1,7 +1,7 @@
 """Base collector class for OBD data collection."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, FrozenSet, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..connection.manager import ConnectionManager
@@ -19,11 +19,47 @@ class BaseCollector(ABC):
         """
         self._conn_manager = connection_manager
 
+        # (connection, supported command names, supported Mode 01 names)
+        self._supported_cache: Optional[Tuple[Any, FrozenSet[str], FrozenSet[str]]] = None
+
     @property
     def connection(self):
         """Get the underlying OBD connection."""
         return self._conn_manager.connection
 
+    @property
+    def supported_commands(self) -> FrozenSet[str]:
+        """Names of all OBD commands the vehicle supports."""
+        return self._load_supported()[1]
+
+    @property
+    def supported_pids(self) -> FrozenSet[str]:
+        """Names of the Mode 01 (live data) PIDs the vehicle supports."""
+        return self._load_supported()[2]
+
+    def invalidate_support_cache(self) -> None:
+        """Drop the supported-command snapshot so the next check re-reads it."""
+        self._supported_cache = None
+
+    def _load_supported(self) -> Tuple[Any, FrozenSet[str], FrozenSet[str]]:
+        """
+        Snapshot the vehicle's supported commands.
+
+        Support is fixed for a connection, so the snapshot is reused until
+        the connection is closed or replaced.
+        """
+        connection = self.connection
+        cache = self._supported_cache
+        if cache is None or cache[0] is not connection:
+            commands = connection.supported_commands if connection else ()
+            cache = (
+                connection,
+                frozenset(cmd.name for cmd in commands),
+                frozenset(cmd.name for cmd in commands if cmd.mode == 1),
+            )
+            self._supported_cache = cache
+        return cache
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to vehicle."""
@@ -44,6 +80,22 @@ class BaseCollector(ABC):
         """
         pass
 
+    def collect_many(self, requests: Iterable[Any]) -> List[Any]:
+        """
+        Collect data for several requests in one pass.
+
+        The default calls collect() once per request. Collectors that query
+        by name (e.g. PIDs) override this to check the connection and look
+        up commands once for the whole batch.
+
+        Args:
+            requests: Items to collect (meaning depends on collector implementation)
+
+        Returns:
+            Collected data, one entry per request in order
+        """
+        return [self.collect() for _ in requests]
+
     @abstractmethod
     def is_supported(self) -> bool:
         """
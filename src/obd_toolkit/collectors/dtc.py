@@ -12,6 +12,9 @@ from ..decoders.dtc import DTCDecoder
 
 logger = logging.getLogger(__name__)
 
+# DTC letter for the top two bits of the first byte
+_DTC_CATEGORIES = "PCBU"
+
 
 class DTCCollector(BaseCollector):
     """Collects Diagnostic Trouble Codes from vehicle."""
@@ -37,10 +40,8 @@ class DTCCollector(BaseCollector):
 
     def is_supported(self) -> bool:
         """Check if DTC reading is supported."""
-        if not self.connection:
-            return False
         # Mode 03 (GET_DTC) is standard and should be supported
-        return obd.commands.GET_DTC in self.connection.supported_commands
+        return obd.commands.GET_DTC.name in self.supported_commands
 
     def read_stored(self) -> List[DTCInfo]:
         """
@@ -212,18 +213,11 @@ class DTCCollector(BaseCollector):
         for msg in messages:
             data = msg.data
 
-            # Each DTC is 2 bytes
-            for i in range(0, len(data) - 1, 2):
-                byte1 = data[i]
-                byte2 = data[i + 1]
-
+            # Each DTC is 2 bytes; pair them up with strided slices
+            for byte1, byte2 in zip(data[0::2], data[1::2]):
                 # Skip empty codes (0x0000)
-                if byte1 == 0 and byte2 == 0:
-                    continue
-
-                code = self._bytes_to_dtc(byte1, byte2)
-                if code:
-                    dtcs.append((code, ""))
+                if byte1 or byte2:
+                    dtcs.append((self._bytes_to_dtc(byte1, byte2), ""))
 
         return dtcs
 
@@ -231,9 +225,7 @@ class DTCCollector(BaseCollector):
     def _bytes_to_dtc(byte1: int, byte2: int) -> Optional[str]:
         """Convert two bytes to DTC code string."""
         # First two bits of byte1 determine the category
-        category_bits = (byte1 >> 6) & 0x03
-        categories = {0: 'P', 1: 'C', 2: 'B', 3: 'U'}
-        category = categories.get(category_bits, 'P')
+        category = _DTC_CATEGORIES[(byte1 >> 6) & 0x03]
 
         # Remaining bits form the code number
         code_num = ((byte1 & 0x3F) << 8) | byte2
@@ -1,11 +1,14 @@
 """Live data collector for real-time monitoring."""
 
-import time
+import asyncio
 import logging
-from typing import List, Dict, Optional, Callable
+import time
+from types import MappingProxyType
+from typing import AsyncIterator, List, Dict, Mapping, Optional, Callable, Tuple
 from threading import Thread, Event
-from queue import Queue, Empty
+from collections import deque
 from datetime import datetime
+from enum import Enum
 
 from .base import BaseCollector
 from .pid import PIDCollector
@@ -14,6 +17,17 @@ from ..models.session import PIDSample
 
 logger = logging.getLogger(__name__)
 
+# How many intervals the stream loop may fall behind before it gives up
+# catching up and restarts its schedule
+_MAX_LAG_INTERVALS = 5
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with a new sample when the buffer is full."""
+    DROP_OLD = "drop-old"
+    DROP_NEW = "drop-new"
+    BLOCK = "block"
+
 
 class LiveDataCollector(BaseCollector):
     """Collects real-time PID data with continuous streaming support."""
@@ -22,7 +36,9 @@ class LiveDataCollector(BaseCollector):
         self,
         connection_manager,
         pids: Optional[List[str]] = None,
-        interval_ms: int = 250
+        interval_ms: int = 250,
+        buffer_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLD,
     ):
         """
         Initialize live data collector.
@@ -31,33 +47,47 @@ class LiveDataCollector(BaseCollector):
             connection_manager: Connection manager instance
             pids: List of PIDs to monitor (None = use defaults)
             interval_ms: Polling interval in milliseconds
+            buffer_size: Maximum number of samples held until read
+            overflow: What to do when the buffer is full (drop the oldest
+                sample, drop the new one, or wait for the reader)
         """
         super().__init__(connection_manager)
         self._pid_collector = PIDCollector(connection_manager)
 
         # Default PIDs if none specified
-        self._pids = pids or ["RPM", "SPEED", "COOLANT_TEMP", "ENGINE_LOAD", "THROTTLE_POS"]
+        # (copied, so add_pid/remove_pid never modify the caller's list)
+        self._pids = list(pids or ["RPM", "SPEED", "COOLANT_TEMP", "ENGINE_LOAD", "THROTTLE_POS"])
         self._interval = interval_ms / 1000.0
 
         # Streaming state
         self._running = False
         self._thread: Optional[Thread] = None
         self._stop_event = Event()
+        self._samples_ready = Event()
 
         # Data storage
-        self._buffer: Queue[PIDSample] = Queue(maxsize=1000)
+        # Ring buffer: with maxlen set, append() evicts the oldest sample
+        # itself, so the drop-old path is a single call
+        self._buffer: deque[PIDSample] = deque(maxlen=buffer_size)
+        self._space_available = Event()
+        self._overflow = OverflowPolicy(overflow)
+        # Copy-on-write: each poll publishes a new dict, so get_latest() can
+        # hand out read-only views without copying
         self._latest_values: Dict[str, PIDValue] = {}
-        self._callbacks: List[Callable[[PIDSample], None]] = []
+        # Replaced, never mutated, so the streaming thread can iterate it
+        # while other threads subscribe or unsubscribe
+        self._callbacks: Tuple[Callable[[PIDSample], None], ...] = ()
 
         # Statistics
         self._sample_count = 0
         self._error_count = 0
+        self._dropped_count = 0
         self._start_time: Optional[datetime] = None
 
     def collect(self) -> PIDSnapshot:
         """Collect single snapshot of all monitored PIDs."""
         self._ensure_connected()
-        return PIDSnapshot(values=self.get_latest())
+        return PIDSnapshot(values=dict(self.get_latest()))
 
     def is_supported(self) -> bool:
         """Check if live monitoring is supported."""
@@ -102,6 +132,7 @@ class LiveDataCollector(BaseCollector):
         self._running = True
         self._sample_count = 0
         self._error_count = 0
+        self._dropped_count = 0
         self._start_time = datetime.now()
 
         self._thread = Thread(target=self._stream_loop, daemon=True)
@@ -124,37 +155,33 @@ class LiveDataCollector(BaseCollector):
 
     def _stream_loop(self) -> None:
         """Background thread loop for continuous data collection."""
+        # Polls are scheduled on fixed deadlines so the time spent reading
+        # does not stretch the interval
+        next_deadline = time.monotonic()
         while not self._stop_event.is_set():
             try:
-                # Collect all PIDs
+                # Collect all PIDs in one batch (copy the list, add_pid and
+                # remove_pid may change it from another thread)
+                pids = list(self._pids)
                 values = {}
-                for pid in self._pids:
-                    try:
-                        value = self._pid_collector.read_pid(pid)
+                try:
+                    for pid, value in zip(pids, self._pid_collector.collect_many(pids)):
                         if value:
                             values[pid] = value
-                    except Exception as e:
-                        logger.debug(f"Error reading {pid}: {e}")
-                        self._error_count += 1
+                except Exception as e:
+                    logger.debug(f"Error reading PIDs: {e}")
+                    self._error_count += 1
 
                 # Update latest values
-                self._latest_values.update(values)
+                self._latest_values = {**self._latest_values, **values}
 
                 # Create sample
                 if values:
                     snapshot = PIDSnapshot(values=values)
                     sample = PIDSample.from_snapshot(snapshot)
 
-                    # Add to buffer (non-blocking)
-                    try:
-                        self._buffer.put_nowait(sample)
-                    except:
-                        # Buffer full, discard oldest
-                        try:
-                            self._buffer.get_nowait()
-                            self._buffer.put_nowait(sample)
-                        except:
-                            pass
+                    self._buffer_sample(sample)
+                    self._samples_ready.set()
 
                     # Notify callbacks
                     for callback in self._callbacks:
@@ -165,27 +192,73 @@ class LiveDataCollector(BaseCollector):
 
                     self._sample_count += 1
 
-                # Wait for next interval
-                time.sleep(self._interval)
+                # Wait for the next deadline, waking early if asked to stop
+                next_deadline += self._interval
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                elif delay < -_MAX_LAG_INTERVALS * self._interval:
+                    next_deadline = time.monotonic()
 
             except Exception as e:
                 logger.error(f"Stream loop error: {e}")
                 self._error_count += 1
-                time.sleep(0.5)
+                self._stop_event.wait(0.5)
+
+    def _buffer_sample(self, sample: PIDSample) -> None:
+        """Add a sample to the buffer, applying the overflow policy if it is full."""
+        buffer = self._buffer
+        if len(buffer) < buffer.maxlen:
+            buffer.append(sample)
+            return
+
+        if self._overflow == OverflowPolicy.DROP_OLD:
+            buffer.append(sample)
+        elif self._overflow == OverflowPolicy.BLOCK:
+            # Wait for the reader to make room, but keep honouring stop requests
+            self._samples_ready.set()
+            while not self._stop_event.is_set():
+                self._space_available.clear()
+                if len(buffer) < buffer.maxlen:
+                    buffer.append(sample)
+                    return
+                self._space_available.wait(0.1)
+
+        self._dropped_count += 1
+
+    def get_latest(self) -> Mapping[str, PIDValue]:
+        """
+        Get most recent values for all monitored PIDs.
 
-    def get_latest(self) -> Dict[str, PIDValue]:
-        """Get most recent values for all monitored PIDs."""
+        Returns a read-only view of one poll's published values; it does
+        not change afterwards, so it is safe to iterate while streaming.
+        """
         if self._running:
-            return self._latest_values.copy()
+            return MappingProxyType(self._latest_values)
 
         # If not streaming, do a fresh read
         values = {}
-        for pid in self._pids:
-            value = self._pid_collector.read_pid(pid)
+        for pid, value in zip(self._pids, self._pid_collector.collect_many(self._pids)):
             if value:
                 values[pid] = value
         self._latest_values = values
-        return values.copy()
+        return MappingProxyType(values)
+
+    def wait_for_samples(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the streaming thread buffers a new sample.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = wait indefinitely)
+
+        Returns:
+            True if samples are ready, False if the timeout expired
+        """
+        ready = self._samples_ready.wait(timeout)
+        # Clear before the caller drains, so a sample buffered during the
+        # drain sets the event again for the next wait
+        self._samples_ready.clear()
+        return ready
 
     def get_buffered_samples(self, max_samples: int = 100) -> List[PIDSample]:
         """
@@ -197,22 +270,59 @@ class LiveDataCollector(BaseCollector):
         Returns:
             List of samples (oldest first)
         """
+        buffer = self._buffer
         samples = []
-        while len(samples) < max_samples:
+        # Pop rather than snapshot, the streaming thread may evict or append
+        # while we read
+        for _ in range(min(max_samples, len(buffer))):
             try:
-                sample = self._buffer.get_nowait()
-                samples.append(sample)
-            except Empty:
+                samples.append(buffer.popleft())
+            except IndexError:
                 break
+        self._space_available.set()
         return samples
 
     def clear_buffer(self) -> None:
         """Clear the sample buffer."""
-        while not self._buffer.empty():
-            try:
-                self._buffer.get_nowait()
-            except Empty:
-                break
+        self._buffer.clear()
+        self._space_available.set()
+
+    async def stream(self, max_queued: int = 100) -> AsyncIterator[PIDSample]:
+        """
+        Yield samples to asyncio code as the streaming thread records them.
+
+        Samples are handed to the event loop as they are taken, so there is
+        no polling delay. Streaming must be started separately; python-OBD
+        is blocking, so reads stay on the collector's thread. Breaking out
+        of the loop unsubscribes once the generator is closed; wrap it in
+        contextlib.aclosing() to do that straight away.
+
+        Args:
+            max_queued: Samples held for a slow consumer before the oldest
+                is dropped
+
+        Yields:
+            PID samples, oldest first
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[PIDSample] = asyncio.Queue(maxsize=max_queued)
+
+        def enqueue(sample: PIDSample) -> None:
+            # Runs on the event loop thread
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(sample)
+
+        def forward(sample: PIDSample) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(enqueue, sample)
+
+        self.subscribe(forward)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(forward)
 
     def subscribe(self, callback: Callable[[PIDSample], None]) -> None:
         """
@@ -222,12 +332,12 @@ class LiveDataCollector(BaseCollector):
             callback: Function called with each new sample
         """
         if callback not in self._callbacks:
-            self._callbacks.append(callback)
+            self._callbacks = (*self._callbacks, callback)
 
     def unsubscribe(self, callback: Callable[[PIDSample], None]) -> None:
         """Unsubscribe from updates."""
         if callback in self._callbacks:
-            self._callbacks.remove(callback)
+            self._callbacks = tuple(c for c in self._callbacks if c is not callback)
 
     def set_interval(self, interval_ms: int) -> None:
         """Set polling interval in milliseconds."""
@@ -250,7 +360,8 @@ class LiveDataCollector(BaseCollector):
             "sample_count": self._sample_count,
             "error_count": self._error_count,
             "samples_per_second": self.samples_per_second,
-            "buffer_size": self._buffer.qsize(),
+            "buffer_size": len(self._buffer),
+            "dropped_samples": self._dropped_count,
             "monitored_pids": len(self._pids),
             "interval_ms": self._interval * 1000,
         }
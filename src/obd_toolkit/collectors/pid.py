@@ -1,38 +1,230 @@
 """PID (Parameter ID) collector."""
 
-from typing import List, Optional, Dict, Set
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Dict, FrozenSet, Tuple
+import copy
 import logging
 
 import obd
+from obd import OBDCommand
 
 from .base import BaseCollector
 from ..models.pid import PIDValue, PIDInfo, PIDSnapshot, COMMON_PIDS
 
 logger = logging.getLogger(__name__)
 
+# Most ECUs answer at most 6 PIDs in one Mode 01 request
+MAX_PIDS_PER_REQUEST = 6
+
+# Positive response to a Mode 01 request
+_MODE_01_RESPONSE = 0x41
+
+# ELM327 protocol IDs of ISO 15765-4 (CAN); ECUs on the older buses often
+# answer only the first PID of a multi-PID request
+_CAN_PROTOCOL_IDS = frozenset({"6", "7", "8", "9"})
+
+# Consecutive failed or incomplete multi-PID replies before packing is
+# given up for the connection
+_MAX_PACKED_FAILURES = 3
+
+
+@lru_cache(maxsize=None)
+def _get_command(pid_name: str) -> Optional[OBDCommand]:
+    """Look up a python-OBD command by name (memoized, the table is static)."""
+    if obd.commands.has_name(pid_name):
+        return obd.commands[pid_name]
+    return None
+
+
+def _to_pid_value(pid_name: str, cmd: OBDCommand, response) -> PIDValue:
+    """Convert a python-OBD response into a PIDValue."""
+    if response.is_null():
+        return PIDValue(
+            pid=pid_name,
+            name=cmd.name,
+            is_valid=False,
+            error_message="No response from vehicle"
+        )
+
+    # Extract value and unit
+    value = response.value
+
+    # Handle pint quantities (python-OBD uses pint for units)
+    try:
+        numeric_value = value.magnitude
+    except AttributeError:
+        numeric_value = value
+        unit = ""
+    else:
+        unit = str(getattr(value, 'units', ""))
+
+    return PIDValue(
+        pid=pid_name,
+        name=cmd.name,
+        value=numeric_value,
+        unit=unit,
+        is_valid=True,
+    )
+
 
 class PIDCollector(BaseCollector):
     """Collects PID data from vehicle."""
 
     def __init__(self, connection_manager):
         super().__init__(connection_manager)
-        self._supported_pids: Optional[Set[str]] = None
+        # (connection, is CAN, consecutive multi-PID failures)
+        self._packing: Optional[Tuple[Any, bool, int]] = None
+
+        # (supported PIDs, list_all_pids result) for the last supported set
+        self._pid_list_cache: Optional[Tuple[FrozenSet[str], List[PIDInfo]]] = None
 
     def collect(self) -> PIDSnapshot:
         """Collect all supported PIDs."""
         self._ensure_connected()
 
+        pid_names = self.get_supported_pids()
         values = {}
-        for pid_name in self.get_supported_pids():
-            value = self.read_pid(pid_name)
+        for pid_name, value in zip(pid_names, self.collect_many(pid_names)):
             if value:
                 values[pid_name] = value
 
         return PIDSnapshot(values=values)
 
+    def collect_many(self, pid_names: Iterable[str]) -> List[Optional[PIDValue]]:
+        """
+        Read several PIDs back to back.
+
+        Supported Mode 01 PIDs are requested several at a time (see
+        read_multi_packed); the rest, and any the vehicle left out of a
+        packed reply, are queried one by one.
+
+        Args:
+            pid_names: Names of the PIDs to read
+
+        Returns:
+            PIDValue (or None) for each name, in order
+        """
+        self._ensure_connected()
+        pid_names = list(pid_names)
+        packed = self.read_multi_packed(pid_names)
+        return [packed.get(pid_name) or self._query_pid(pid_name) for pid_name in pid_names]
+
+    def read_multi_packed(self, pid_names: Iterable[str]) -> Dict[str, PIDValue]:
+        """
+        Read supported Mode 01 PIDs with multi-PID requests.
+
+        Up to MAX_PIDS_PER_REQUEST PIDs share one request (e.g. "01 0C 0D"),
+        so the adapter round-trip is paid once per group instead of once
+        per PID. Packing is only used on CAN protocols, and is given up for
+        the connection after a few consecutive replies that are missing or
+        leave PIDs out.
+
+        Args:
+            pid_names: Names of the PIDs to read
+
+        Returns:
+            Dictionary of pid_name -> PIDValue for the PIDs found in the
+            replies (unsupported or unanswered PIDs are left out)
+        """
+        results: Dict[str, PIDValue] = {}
+        if not self._can_pack():
+            return results
+
+        supported = self.supported_pids
+        commands: Dict[int, OBDCommand] = {}
+        for pid_name in pid_names:
+            if pid_name not in supported:
+                continue
+            cmd = _get_command(pid_name)
+            if cmd is not None and cmd.mode == 1:
+                commands[cmd.pid] = cmd
+
+        # A single PID gains nothing from packing
+        if len(commands) < 2:
+            return results
+
+        pids = list(commands)
+        for start in range(0, len(pids), MAX_PIDS_PER_REQUEST):
+            group = {pid: commands[pid] for pid in pids[start:start + MAX_PIDS_PER_REQUEST]}
+            try:
+                replies = self._query_packed(group)
+            except Exception as e:
+                logger.debug(f"Multi-PID request failed: {e}")
+                replies = None
+
+            # PIDs left out of a reply are read one by one by the caller
+            for pid, messages in (replies or {}).items():
+                cmd = group[pid]
+                results[cmd.name] = _to_pid_value(cmd.name, cmd, cmd(messages))
+
+            self._record_packed(replies is not None and len(replies) == len(group))
+            if not self._can_pack():
+                break
+
+        return results
+
+    def _can_pack(self) -> bool:
+        """Check whether multi-PID requests are used on the current connection."""
+        connection = self.connection
+        state = self._packing
+        if state is None or state[0] is not connection:
+            is_can = bool(connection) and connection.protocol_id() in _CAN_PROTOCOL_IDS
+            state = self._packing = (connection, is_can, 0)
+        return state[1] and state[2] < _MAX_PACKED_FAILURES
+
+    def _record_packed(self, complete: bool) -> None:
+        """Count a multi-PID reply towards giving up on packing."""
+        connection, is_can, failures = self._packing
+        failures = 0 if complete else failures + 1
+        if failures == _MAX_PACKED_FAILURES:
+            logger.info("Vehicle does not answer multi-PID requests, reading PIDs one by one")
+        self._packing = (connection, is_can, failures)
+
+    def _query_packed(self, group: Dict[int, OBDCommand]) -> Optional[Dict[int, list]]:
+        """
+        Send one multi-PID request and split the replies per PID.
+
+        Returns:
+            Dictionary of PID number -> messages shaped like a single-PID
+            reply, or None if nothing came back
+        """
+        request = OBDCommand(
+            "PACKED_01",
+            "Multi-PID request",
+            b"01" + b"".join(b"%02X" % pid for pid in group),
+            0,
+            lambda messages: messages,
+        )
+        response = self.connection.query(request, force=True)
+        if response.is_null():
+            return None
+
+        # Each reply is 41 <pid> <data> <pid> <data> ...; rebuild a
+        # 41 <pid> <data> message per PID for the command's own decoder
+        replies: Dict[int, list] = {}
+        for message in response.messages:
+            data = message.data
+            if not data or data[0] != _MODE_01_RESPONSE:
+                continue
+            i = 1
+            while i < len(data):
+                cmd = group.get(data[i])
+                if cmd is None:
+                    break
+                size = cmd.bytes - 2
+                payload = data[i + 1:i + 1 + size]
+                if len(payload) < size:
+                    break
+                part = copy.copy(message)
+                part.data = bytearray((_MODE_01_RESPONSE, cmd.pid)) + payload
+                replies.setdefault(cmd.pid, []).append(part)
+                i += 1 + size
+
+        return replies
+
     def is_supported(self) -> bool:
         """Check if PID reading is supported."""
-        return self.is_connected and len(self.get_supported_pids()) > 0
+        return self.is_connected and bool(self.supported_pids)
 
     def read_pid(self, pid_name: str) -> Optional[PIDValue]:
         """
@@ -45,9 +237,12 @@ class PIDCollector(BaseCollector):
             PIDValue or None if not available
         """
         self._ensure_connected()
+        return self._query_pid(pid_name)
 
+    def _query_pid(self, pid_name: str) -> Optional[PIDValue]:
+        """Query a single PID, assuming the connection has been checked."""
         # Get command from obd library
-        cmd = obd.commands.get(pid_name)
+        cmd = _get_command(pid_name)
 
         if cmd is None:
             logger.warning(f"Unknown PID: {pid_name}")
@@ -60,35 +255,7 @@ class PIDCollector(BaseCollector):
 
         try:
             response = self.connection.query(cmd)
-
-            if response.is_null():
-                return PIDValue(
-                    pid=pid_name,
-                    name=cmd.name,
-                    is_valid=False,
-                    error_message="No response from vehicle"
-                )
-
-            # Extract value and unit
-            value = response.value
-            unit = ""
-
-            # Handle pint quantities (python-OBD uses pint for units)
-            if hasattr(value, 'magnitude'):
-                numeric_value = value.magnitude
-                unit = str(value.units) if hasattr(value, 'units') else ""
-            elif isinstance(value, (int, float)):
-                numeric_value = value
-            else:
-                numeric_value = value
-
-            return PIDValue(
-                pid=pid_name,
-                name=cmd.name,
-                value=numeric_value,
-                unit=unit,
-                is_valid=True,
-            )
+            return _to_pid_value(pid_name, cmd, response)
 
         except Exception as e:
             logger.error(f"Error reading PID {pid_name}: {e}")
@@ -110,32 +277,18 @@ class PIDCollector(BaseCollector):
             Dictionary of pid_name -> PIDValue
         """
         results = {}
-        for pid_name in pid_names:
-            value = self.read_pid(pid_name)
+        for pid_name, value in zip(pid_names, self.collect_many(pid_names)):
             if value:
                 results[pid_name] = value
         return results
 
     def get_supported_pids(self) -> List[str]:
         """Get list of PIDs supported by the vehicle."""
-        if self._supported_pids is not None:
-            return list(self._supported_pids)
-
-        if not self.connection:
-            return []
-
-        # Get supported commands from connection
-        supported = set()
-        for cmd in self.connection.supported_commands:
-            if cmd.mode == 1:  # Mode 01 = Live data
-                supported.add(cmd.name)
-
-        self._supported_pids = supported
-        return list(supported)
+        return list(self.supported_pids)
 
     def refresh_supported_pids(self) -> List[str]:
         """Refresh the list of supported PIDs."""
-        self._supported_pids = None
+        self.invalidate_support_cache()
         return self.get_supported_pids()
 
     def get_pid_info(self, pid_name: str) -> Optional[PIDInfo]:
@@ -151,24 +304,37 @@ class PIDCollector(BaseCollector):
         # Check our common PIDs first
         if pid_name in COMMON_PIDS:
             info = COMMON_PIDS[pid_name].model_copy()
-            info.is_supported = pid_name in self.get_supported_pids()
+            info.is_supported = pid_name in self.supported_pids
             return info
 
         # Try to get from obd library
-        cmd = obd.commands.get(pid_name)
+        cmd = _get_command(pid_name)
         if cmd:
             return PIDInfo(
                 pid=pid_name,
                 name=cmd.name,
                 description=cmd.desc,
-                is_supported=pid_name in self.get_supported_pids()
+                is_supported=pid_name in self.supported_pids
             )
 
         return None
 
     def list_all_pids(self) -> List[PIDInfo]:
-        """List all known PIDs with support status."""
-        supported = set(self.get_supported_pids())
+        """
+        List all known PIDs with support status.
+
+        The PIDInfo objects are built once per supported-PID snapshot and
+        shared between calls, so treat them as read-only.
+        """
+        supported = self.supported_pids
+        cache = self._pid_list_cache
+        if cache is None or cache[0] is not supported:
+            cache = (supported, self._build_pid_list(supported))
+            self._pid_list_cache = cache
+        return list(cache[1])
+
+    def _build_pid_list(self, supported: FrozenSet[str]) -> List[PIDInfo]:
+        """Build the PIDInfo list for a set of supported PIDs."""
         pids = []
 
         # Add common PIDs
@@ -180,7 +346,7 @@ class PIDCollector(BaseCollector):
         # Add any additional supported PIDs not in common list
         for pid_name in supported:
             if pid_name not in COMMON_PIDS:
-                cmd = obd.commands.get(pid_name)
+                cmd = _get_command(pid_name)
                 if cmd:
                     pids.append(PIDInfo(
                         pid=pid_name,
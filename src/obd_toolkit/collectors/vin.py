@@ -2,6 +2,7 @@
 
 from typing import Optional
 import logging
+import re
 
 import obd
 
@@ -11,6 +12,12 @@ from ..decoders.vin import VINDecoder
 
 logger = logging.getLogger(__name__)
 
+# VINs cannot contain I, O, or Q; misreads are mapped to the likely digit
+_VIN_LOOKALIKES = str.maketrans("IOQ", "100")
+
+# 17 VIN characters starting with a valid WMI region code
+_VIN_PATTERN = re.compile(r"[1-9A-HJ-NPR-Z][0-9A-HJ-NPR-Z]{16}")
+
 
 class VINCollector(BaseCollector):
     """Collects and decodes Vehicle Identification Number."""
@@ -30,9 +37,7 @@ class VINCollector(BaseCollector):
 
     def is_supported(self) -> bool:
         """Check if VIN reading is supported."""
-        if not self.connection:
-            return False
-        return obd.commands.VIN in self.connection.supported_commands
+        return obd.commands.VIN.name in self.supported_commands
 
     def read_vin(self, use_cache: bool = True) -> Optional[str]:
         """
@@ -110,19 +115,16 @@ class VINCollector(BaseCollector):
         cleaned = ''.join(c for c in cleaned if c.isalnum())
 
         # VINs cannot contain I, O, or Q
-        cleaned = cleaned.replace('I', '1').replace('O', '0').replace('Q', '0')
+        cleaned = cleaned.translate(_VIN_LOOKALIKES)
 
         if len(cleaned) == 17:
             return cleaned
 
         # Try to find 17-character sequence
         if len(cleaned) > 17:
-            # Look for likely VIN start patterns
-            for i in range(len(cleaned) - 16):
-                potential = cleaned[i:i+17]
-                # Check if it starts with valid WMI region code
-                if potential[0] in '123456789ABCDEFGHJKLMNPRSTUVWXYZ':
-                    return potential
+            match = _VIN_PATTERN.search(cleaned)
+            if match:
+                return match.group(0)
 
         return None
 
@@ -1,7 +1,8 @@
 """OBD2 adapter detection and configuration."""
 
 import sys
-from typing import Optional, List
+import time
+from typing import Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -61,9 +62,30 @@ class AdapterDetector:
         "bluetooth", "bt", "rfcomm", "bthenum", "bth"
     ]
 
+    # Seconds a port enumeration is reused before the ports are listed again
+    CACHE_TTL = 5.0
+
+    # (monotonic time of the enumeration, adapters found)
+    _cache: Optional[Tuple[float, List[AdapterInfo]]] = None
+
     @classmethod
-    def detect_all(cls) -> List[AdapterInfo]:
-        """Detect all potential OBD2 adapters."""
+    def detect_all(cls, refresh: bool = False) -> List[AdapterInfo]:
+        """
+        Detect all potential OBD2 adapters.
+
+        Enumerating serial ports can take seconds on some platforms, so the
+        result is reused for CACHE_TTL seconds.
+
+        Args:
+            refresh: Enumerate the ports again even if a recent result exists
+
+        Returns:
+            List of detected adapters
+        """
+        now = time.monotonic()
+        if not refresh and cls._cache is not None and now - cls._cache[0] < cls.CACHE_TTL:
+            return list(cls._cache[1])
+
         adapters = []
         ports = serial.tools.list_ports.comports()
 
@@ -72,7 +94,8 @@ class AdapterDetector:
             if adapter:
                 adapters.append(adapter)
 
-        return adapters
+        cls._cache = (now, adapters)
+        return list(adapters)
 
     @classmethod
     def detect_elm327(cls) -> List[AdapterInfo]:
@@ -121,8 +144,10 @@ class AdapterDetector:
         if vid and pid:
             is_known_elm327 = (vid, pid) in cls.KNOWN_ELM327_IDS
 
-        # Check for ELM327 keywords
-        has_elm327_keyword = any(kw in all_info for kw in cls.ELM327_KEYWORDS)
+        # Check for ELM327 keywords, unless the VID/PID already identified it
+        has_elm327_keyword = not is_known_elm327 and any(
+            kw in all_info for kw in cls.ELM327_KEYWORDS
+        )
 
         # Check if it's Bluetooth
         is_bluetooth = any(pattern in all_info for pattern in cls.BLUETOOTH_PATTERNS)
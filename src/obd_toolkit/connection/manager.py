@@ -1,7 +1,7 @@
 """Connection manager for OBD2 adapters."""
 
 import logging
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
@@ -10,6 +10,10 @@ from obd import OBDStatus
 
 from .adapter import AdapterDetector, AdapterInfo, AdapterType
 
+if TYPE_CHECKING:
+    from ..collectors.vin import VINCollector
+    from ..models.vehicle import VehicleInfo
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +47,10 @@ class ConnectionManager:
         self._protocol: str = ""
         self._on_state_change: Optional[Callable[[ConnectionState], None]] = None
 
+        # Shared VIN collector; the VIN and decoded vehicle info are fixed for
+        # a connection, so its caches live until disconnect()
+        self._vin_collector: Optional["VINCollector"] = None
+
         if auto_connect:
             self.connect()
 
@@ -207,6 +215,7 @@ class ConnectionManager:
 
         self._adapter_info = None
         self._protocol = ""
+        self._vin_collector = None
         self._set_state(ConnectionState.DISCONNECTED)
         logger.info("Disconnected from OBD2 adapter")
 
@@ -216,6 +225,34 @@ class ConnectionManager:
         self.disconnect()
         return self.connect(port=port)
 
+    def read_vin(self) -> Optional[str]:
+        """
+        Read the vehicle's VIN, querying the vehicle once per connection.
+
+        Returns:
+            17-character VIN string or None
+        """
+        return self._get_vin_collector().read_vin()
+
+    def get_vehicle_info(self, use_online: bool = False) -> Optional["VehicleInfo"]:
+        """
+        Get decoded vehicle information, reading the VIN once per connection.
+
+        Args:
+            use_online: Use NHTSA API for additional details
+
+        Returns:
+            VehicleInfo or None if the VIN could not be read
+        """
+        return self._get_vin_collector().get_vehicle_info(use_online=use_online)
+
+    def _get_vin_collector(self) -> "VINCollector":
+        """Get the VIN collector for the current connection."""
+        if self._vin_collector is None:
+            from ..collectors.vin import VINCollector
+            self._vin_collector = VINCollector(self)
+        return self._vin_collector
+
     def get_supported_commands(self) -> List[str]:
         """Get list of supported OBD commands."""
         if not self._connection:
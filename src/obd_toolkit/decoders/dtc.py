@@ -3,13 +3,18 @@
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set, Tuple
 
 from ..models.dtc import DTCInfo, DTCCategory, DTCSeverity
 
 logger = logging.getLogger(__name__)
 
 
+def _trigrams(text: str) -> Set[str]:
+    """Get the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class DTCDecoder:
     """Decodes DTC codes into human-readable information."""
 
@@ -23,6 +28,11 @@ class DTCDecoder:
         self._codes_db: Dict[str, Dict] = {}
         self._loaded = False
 
+        # Lowercased "code\0description" per code and a trigram -> row index,
+        # built on the first search
+        self._search_rows: Optional[List[Tuple[str, str]]] = None
+        self._trigram_index: Dict[str, Set[int]] = {}
+
         if codes_file:
             self._load_codes(codes_file)
         else:
@@ -105,17 +115,43 @@ class DTCDecoder:
             List of matching DTCInfo objects
         """
         query = query.lower()
-        results = []
+        rows = self._get_search_rows()
+
+        # Only rows containing every trigram of the query can match; queries
+        # shorter than a trigram check every row
+        candidates = range(len(rows))
+        query_trigrams = _trigrams(query)
+        if query_trigrams:
+            postings = sorted(
+                (self._trigram_index.get(t, set()) for t in query_trigrams), key=len
+            )
+            candidates = sorted(set.intersection(*postings))
 
-        for code, data in self._codes_db.items():
-            desc = data.get("description", "").lower()
-            if query in code.lower() or query in desc:
+        results = []
+        for index in candidates:
+            code, text = rows[index]
+            if query in text:
                 info = self.decode(code)
                 if info:
                     results.append(info)
 
         return results
 
+    def _get_search_rows(self) -> List[Tuple[str, str]]:
+        """Get the search text of every code, building the trigram index on first use."""
+        if self._search_rows is None:
+            rows = []
+            index: Dict[str, Set[int]] = {}
+            for code, data in self._codes_db.items():
+                # NUL keeps a match from spanning the code and the description
+                text = f"{code.lower()}\0{data.get('description', '').lower()}"
+                for trigram in _trigrams(text):
+                    index.setdefault(trigram, set()).add(len(rows))
+                rows.append((code, text))
+            self._search_rows = rows
+            self._trigram_index = index
+        return self._search_rows
+
     def get_codes_by_system(self, system_code: str) -> List[DTCInfo]:
         """
         Get all codes for a specific system.
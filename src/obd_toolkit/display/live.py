@@ -1,7 +1,7 @@
 """Live data display for real-time monitoring."""
 
 import time
-from typing import Dict, List, Optional, Callable
+from typing import List, Mapping, Optional, Callable
 from datetime import datetime
 from threading import Event
 
@@ -29,7 +29,7 @@ class LiveDisplay:
 
     def create_dashboard(
         self,
-        pid_values: Dict[str, PIDValue],
+        pid_values: Mapping[str, PIDValue],
         vehicle_info: Optional[str] = None,
         connection_info: Optional[str] = None,
     ) -> Panel:
@@ -89,7 +89,7 @@ class LiveDisplay:
             border_style="cyan",
         )
 
-    def create_gauge_display(self, pid_values: Dict[str, PIDValue]) -> Panel:
+    def create_gauge_display(self, pid_values: Mapping[str, PIDValue]) -> Panel:
         """Create a gauge-style display for key metrics."""
         lines = []
 
@@ -139,7 +139,7 @@ class LiveDisplay:
 
     def start_monitoring(
         self,
-        get_values: Callable[[], Dict[str, PIDValue]],
+        get_values: Callable[[], Mapping[str, PIDValue]],
         refresh_rate: float = 0.5,
         vehicle_info: Optional[str] = None,
         connection_info: Optional[str] = None,
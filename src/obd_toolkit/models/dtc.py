@@ -1,7 +1,7 @@
 """Data models for Diagnostic Trouble Codes (DTCs)."""
 
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Tuple, FrozenSet
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -140,10 +140,24 @@ class DTCReadResult(BaseModel):
     @property
     def has_critical(self) -> bool:
         """Check if any critical codes are present."""
-        all_codes = self.stored_codes + self.pending_codes + self.permanent_codes
-        return any(dtc.severity == DTCSeverity.CRITICAL for dtc in all_codes)
+        return bool(self.critical_codes)
 
     @property
     def all_codes(self) -> List[DTCInfo]:
         """Get all codes as a single list."""
         return self.stored_codes + self.pending_codes + self.permanent_codes
+
+    @property
+    def critical_codes(self) -> Tuple[DTCInfo, ...]:
+        """Get all codes with critical severity."""
+        return tuple(dtc for dtc in self.all_codes if dtc.severity == DTCSeverity.CRITICAL)
+
+    @property
+    def stored_code_set(self) -> FrozenSet[str]:
+        """Get the code strings of all stored codes."""
+        return frozenset(dtc.code for dtc in self.stored_codes)
+
+    @property
+    def pending_code_set(self) -> FrozenSet[str]:
+        """Get the code strings of all pending codes."""
+        return frozenset(dtc.code for dtc in self.pending_codes)
@@ -285,10 +285,10 @@ COMMON_PIDS = {
 
 # PID presets for common monitoring scenarios
 PID_PRESETS = {
-    "engine": ["RPM", "ENGINE_LOAD", "COOLANT_TEMP", "THROTTLE_POS", "TIMING_ADVANCE"],
-    "fuel": ["MAF", "FUEL_PRESSURE", "SHORT_FUEL_TRIM_1", "LONG_FUEL_TRIM_1", "FUEL_LEVEL"],
-    "sensors": ["COOLANT_TEMP", "INTAKE_TEMP", "AMBIENT_AIR_TEMP", "BAROMETRIC_PRESSURE"],
-    "performance": ["RPM", "SPEED", "ENGINE_LOAD", "THROTTLE_POS", "MAF"],
-    "economy": ["RPM", "SPEED", "MAF", "ENGINE_LOAD", "FUEL_LEVEL"],
-    "all": list(COMMON_PIDS.keys()),
+    "engine": ("RPM", "ENGINE_LOAD", "COOLANT_TEMP", "THROTTLE_POS", "TIMING_ADVANCE"),
+    "fuel": ("MAF", "FUEL_PRESSURE", "SHORT_FUEL_TRIM_1", "LONG_FUEL_TRIM_1", "FUEL_LEVEL"),
+    "sensors": ("COOLANT_TEMP", "INTAKE_TEMP", "AMBIENT_AIR_TEMP", "BAROMETRIC_PRESSURE"),
+    "performance": ("RPM", "SPEED", "ENGINE_LOAD", "THROTTLE_POS", "MAF"),
+    "economy": ("RPM", "SPEED", "MAF", "ENGINE_LOAD", "FUEL_LEVEL"),
+    "all": tuple(COMMON_PIDS),
 }
@@ -1,15 +1,40 @@
 """Data models for diagnostic sessions."""
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple, Callable
+from operator import itemgetter
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
+
 from .dtc import DTCReadResult
 from .pid import PIDValue, PIDSnapshot
 from .vehicle import VehicleInfo
 
 
+def _row_getter(layout: Tuple[str, ...]) -> Callable[[Dict[str, float]], Tuple[float, ...]]:
+    """Build a function that picks the layout's PIDs out of a values dict as a tuple."""
+    if len(layout) > 1:
+        return itemgetter(*layout)
+    if layout:
+        pid = layout[0]
+        return lambda values: (values[pid],)
+    return lambda values: ()
+
+
+def _extend_columns(
+    columns: Dict[str, List[float]],
+    layout: Tuple[str, ...],
+    rows: List[Tuple[float, ...]]
+) -> None:
+    """Append rows that share one layout to the per-PID columns."""
+    if not rows:
+        return
+    for pid, column in zip(layout, zip(*rows)):
+        columns.setdefault(pid, []).extend(column)
+
+
 class PIDSample(BaseModel):
     """A timestamped sample of PID data."""
 
@@ -101,6 +126,13 @@ class DiagnosticSession(BaseModel):
     notes: str = Field(default="")
     tags: List[str] = Field(default_factory=list)
 
+    # Columnar (per-PID) view of pid_samples, extended lazily
+    _columns: Dict[str, List[float]] = PrivateAttr(default_factory=dict)
+    _columns_source: Optional[List[PIDSample]] = PrivateAttr(default=None)
+    _columns_synced: int = PrivateAttr(default=0)
+    _pid_arrays: Dict[np.dtype, Dict[str, np.ndarray]] = PrivateAttr(default_factory=dict)
+    _series_version: int = PrivateAttr(default=0)
+
     @property
     def duration_seconds(self) -> Optional[float]:
         """Get session duration in seconds."""
@@ -120,8 +152,18 @@ class DiagnosticSession(BaseModel):
 
     def add_sample(self, sample: PIDSample) -> None:
         """Add a PID sample to the session."""
+        # Fold the sample into the columnar view as it is recorded, so
+        # analyzers find the columns ready instead of re-walking the samples
+        self._sync_columns()
         self.pid_samples.append(sample)
 
+        columns = self._columns
+        for pid, value in sample.values.items():
+            columns.setdefault(pid, []).append(value)
+        self._columns_synced += 1
+        self._pid_arrays = {}
+        self._series_version += 1
+
     def add_analysis(self, result: AnalysisResult) -> None:
         """Add an analysis result."""
         self.analysis_results.append(result)
@@ -134,10 +176,98 @@ class DiagnosticSession(BaseModel):
         """Get time series data for a specific PID."""
         series = []
         for sample in self.pid_samples:
-            if pid_name in sample.values:
-                series.append((sample.timestamp, sample.values[pid_name]))
+            value = sample.values.get(pid_name)
+            if value is not None:
+                series.append((sample.timestamp, value))
         return series
 
+    @property
+    def series_version(self) -> int:
+        """
+        Counter that changes whenever the PID series change.
+
+        Appending samples, or replacing or shrinking pid_samples, bumps the
+        counter. Editing the values of samples already in the list does not,
+        and is not reflected in get_pid_arrays() either.
+        """
+        self._sync_columns()
+        return self._series_version
+
+    @property
+    def available_pids(self) -> FrozenSet[str]:
+        """Names of all PIDs that appear in at least one sample."""
+        self._sync_columns()
+        return frozenset(self._columns)
+
+    def get_pid_arrays(self, dtype: np.dtype = np.float64) -> Dict[str, np.ndarray]:
+        """
+        Get the values of every PID as arrays, in sample order.
+
+        The arrays are built from pid_samples and shared between callers,
+        so they are read-only. Samples appended since the last call are
+        folded in incrementally.
+
+        Args:
+            dtype: Element type; float32 halves memory traffic for bulk
+                statistics at the cost of about 7 significant digits
+
+        Returns:
+            Dictionary of PID name -> array of values
+        """
+        self._sync_columns()
+
+        dtype = np.dtype(dtype)
+        arrays = self._pid_arrays.get(dtype)
+        if arrays is None:
+            arrays = {}
+            for pid, column in self._columns.items():
+                values = np.array(column, dtype=dtype)
+                values.flags.writeable = False
+                arrays[pid] = values
+            self._pid_arrays[dtype] = arrays
+
+        return arrays
+
+    def _sync_columns(self) -> None:
+        """Bring the columnar view up to date with pid_samples."""
+        samples = self.pid_samples
+
+        # pid_samples was reassigned or shrunk, start over
+        if samples is not self._columns_source or len(samples) < self._columns_synced:
+            self._columns = {}
+            self._columns_source = samples
+            self._columns_synced = 0
+            self._pid_arrays = {}
+            self._series_version += 1
+
+        if len(samples) == self._columns_synced:
+            return
+
+        # Loggers poll a fixed PID list, so consecutive samples usually share
+        # one key set; specialize a row getter per key set and transpose each
+        # run of rows into the columns in one go
+        columns = self._columns
+        layout: Tuple[str, ...] = ()
+        getter = _row_getter(layout)
+        rows: List[Tuple[float, ...]] = []
+        for sample in samples[self._columns_synced:]:
+            values = sample.values
+            if len(values) == len(layout):
+                try:
+                    rows.append(getter(values))
+                    continue
+                except KeyError:
+                    pass
+            _extend_columns(columns, layout, rows)
+            layout = tuple(values)
+            getter = _row_getter(layout)
+            rows = [getter(values)]
+        _extend_columns(columns, layout, rows)
+
+        self._columns_synced = len(samples)
+        self._pid_arrays = {}
+        self._series_version += 1
+
     def get_latest_values(self) -> Dict[str, float]:
         """Get the most recent values for all PIDs."""
         if not self.pid_samples:
@@ -7,6 +7,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+import numpy as np
+
 from ..models.session import DiagnosticSession, PIDSample
 from ..models.dtc import DTCReadResult
 from ..models.vehicle import VehicleInfo
@@ -265,7 +267,7 @@ class HistoryManager:
 
         Args:
             session_id: Session ID to export
-            format: Export format ('csv' or 'json')
+            format: Export format ('csv', 'json' or 'npz')
             output_path: Output file path (auto-generated if None)
 
         Returns:
@@ -284,6 +286,8 @@ class HistoryManager:
 
         if format == "csv":
             return self._export_csv(session, filepath)
+        elif format == "npz":
+            return self._export_npz(session, filepath)
         else:
             return self._export_json(session, filepath)
 
@@ -294,20 +298,16 @@ class HistoryManager:
                 return None
 
             # Get all PIDs
-            all_pids = set()
-            for sample in session.pid_samples:
-                all_pids.update(sample.values.keys())
-
-            pids = sorted(all_pids)
+            pids = sorted(session.available_pids)
 
             with open(filepath, 'w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(["timestamp"] + pids)
 
                 for sample in session.pid_samples:
+                    values = sample.values
                     row = [sample.timestamp.isoformat()]
-                    for pid in pids:
-                        row.append(sample.values.get(pid, ""))
+                    row.extend(values.get(pid, "") for pid in pids)
                     writer.writerow(row)
 
             return str(filepath)
@@ -316,6 +316,43 @@ class HistoryManager:
             logger.error(f"CSV export error: {e}")
             return None
 
+    def _export_npz(self, session: DiagnosticSession, filepath: Path) -> Optional[str]:
+        """
+        Export session samples to a compressed NumPy archive.
+
+        The archive holds a 'timestamp' array (datetime64[us]) and one
+        float64 array per PID, aligned with the timestamps; samples that
+        lack a PID hold NaN.
+        """
+        try:
+            if not session.pid_samples:
+                return None
+
+            samples = session.pid_samples
+            columns = {
+                "timestamp": np.array([s.timestamp for s in samples], dtype="datetime64[us]")
+            }
+
+            arrays = session.get_pid_arrays()
+            for pid in sorted(arrays):
+                values = arrays[pid]
+                if len(values) != len(samples):
+                    # Not reported in every sample, spread out with NaN gaps
+                    values = np.array(
+                        [s.values.get(pid, np.nan) for s in samples], dtype=np.float64
+                    )
+                columns[pid] = values
+
+            # Pass a file object so numpy does not append its own suffix
+            with open(filepath, 'wb') as f:
+                np.savez_compressed(f, **columns)
+
+            return str(filepath)
+
+        except Exception as e:
+            logger.error(f"NPZ export error: {e}")
+            return None
+
     def _export_json(self, session: DiagnosticSession, filepath: Path) -> Optional[str]:
         """Export session to JSON."""
         try:
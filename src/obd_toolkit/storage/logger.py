@@ -12,6 +12,10 @@ from ..models.vehicle import VehicleInfo
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for log files; large enough that a batch of CSV rows goes
+# out in one write when it is flushed
+_WRITE_BUFFER_SIZE = 64 * 1024
+
 
 class SessionLogger:
     """Logs diagnostic session data to files."""
@@ -95,7 +99,9 @@ class SessionLogger:
 
     def _init_csv(self, pids: List[str]) -> None:
         """Initialize CSV file with headers."""
-        self._csv_file = open(self._current_file, 'w', newline='')
+        self._csv_file = open(
+            self._current_file, 'w', newline='', buffering=_WRITE_BUFFER_SIZE
+        )
         self._csv_writer = csv.writer(self._csv_file)
 
         # Write header
@@ -127,6 +133,30 @@ class SessionLogger:
             if self._sample_count % 10 == 0:
                 self._csv_file.flush()
 
+    def log_samples(self, samples: List[PIDSample]) -> None:
+        """
+        Log a batch of PID samples to the session.
+
+        CSV rows for the whole batch are written and flushed together.
+
+        Args:
+            samples: PID samples to log, oldest first
+        """
+        if not self._current_session or not samples:
+            return
+
+        for sample in samples:
+            self._current_session.add_sample(sample)
+        self._sample_count += len(samples)
+
+        if self._format == "csv" and self._csv_writer:
+            pids = self._csv_pids
+            self._csv_writer.writerows(
+                [sample.timestamp.isoformat()] + [sample.values.get(pid, "") for pid in pids]
+                for sample in samples
+            )
+            self._csv_file.flush()
+
     def log_dtc_result(self, dtc_result) -> None:
         """Log DTC reading result."""
         if self._current_session:
@@ -174,8 +204,10 @@ class SessionLogger:
 
         data = self._current_session.to_dict_for_export()
 
-        with open(self._current_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Encode in one go and write once; json.dump issues a write per token
+        text = json.dumps(data, indent=2, default=str)
+        with open(self._current_file, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(text)
 
     def add_note(self, note: str) -> None:
         """Add a note to the current session."""
@@ -0,0 +1,194 @@
+"""Tests for the statistical correlator."""
+
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from obd_toolkit.analysis.correlator import Correlator, CorrelationState
+from obd_toolkit.models.session import DiagnosticSession, PIDSample
+
+
+PIDS = ["RPM", "MAF", "SPEED", "COOLANT_TEMP"]
+
+
+def test_compare_to_baseline_sees_in_place_edits():
+    correlator = Correlator()
+    baseline = {"RPM": {"mean": 800.0, "std": 50.0}}
+
+    assert len(correlator.compare_to_baseline({"RPM": 3000.0}, baseline)) == 1
+
+    baseline["RPM"] = {"mean": 3000.0, "std": 50.0}
+    assert correlator.compare_to_baseline({"RPM": 3000.0}, baseline) == []
+
+
+def _ragged_samples(rng, count):
+    """Samples with correlated PIDs, each missing from some samples."""
+    samples = []
+    for _ in range(count):
+        rpm = rng.uniform(700, 4000)
+        values = {
+            "RPM": rpm,
+            "MAF": rpm / 100 + rng.normal(0, 2),
+            "SPEED": rng.uniform(0, 120),
+            "COOLANT_TEMP": 90 + rng.normal(0, 1),
+        }
+        samples.append(PIDSample(values={
+            pid: float(value) for pid, value in values.items() if rng.random() > 0.2
+        }))
+    return samples
+
+
+def _pandas_corr(samples, pids):
+    frame = pd.DataFrame([sample.values for sample in samples], columns=pids)
+    return frame.corr(min_periods=10).to_numpy()
+
+
+def test_correlation_matrix_matches_pandas_on_ragged_samples():
+    samples = _ragged_samples(np.random.default_rng(1), 200)
+    state = CorrelationState()
+    state.update(samples)
+
+    np.testing.assert_allclose(
+        state.correlation_matrix(PIDS), _pandas_corr(samples, PIDS), rtol=1e-9, atol=1e-12
+    )
+
+
+def test_correlation_matrix_folds_in_appended_samples():
+    rng = np.random.default_rng(2)
+    samples = _ragged_samples(rng, 50)
+    state = CorrelationState()
+    state.update(samples)
+
+    samples.extend(_ragged_samples(rng, 150))
+    state.update(samples)
+
+    np.testing.assert_allclose(
+        state.correlation_matrix(PIDS), _pandas_corr(samples, PIDS), rtol=1e-9, atol=1e-12
+    )
+
+
+def test_correlation_matrix_restarts_on_shrunk_or_replaced_samples():
+    rng = np.random.default_rng(3)
+    samples = _ragged_samples(rng, 200)
+    state = CorrelationState()
+    state.update(samples)
+
+    del samples[120:]
+    state.update(samples)
+    np.testing.assert_allclose(
+        state.correlation_matrix(PIDS), _pandas_corr(samples, PIDS), rtol=1e-9, atol=1e-12
+    )
+
+    replaced = _ragged_samples(rng, 80)
+    state.update(replaced)
+    np.testing.assert_allclose(
+        state.correlation_matrix(PIDS), _pandas_corr(replaced, PIDS), rtol=1e-9, atol=1e-12
+    )
+
+
+def _float64_statistics(columns, z_threshold):
+    """Per-PID statistics computed one series at a time in float64."""
+    stats = []
+    for values in columns:
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        mean = values.mean()
+        std = values.std(ddof=1)
+        z_scores = (values - mean) / std if std > 0 else np.zeros(n)
+        outliers = np.count_nonzero(np.abs(z_scores) > z_threshold)
+        spikes = np.count_nonzero(np.abs(np.diff(z_scores)) > z_threshold)
+        slope = np.polyfit(np.arange(n), values, 1)[0]
+        stats.append((n, mean, std, outliers, spikes, slope))
+    return [np.array(column) for column in zip(*stats)]
+
+
+def test_float32_statistics_match_float64():
+    rng = np.random.default_rng(4)
+    rpm = rng.normal(1800, 600, 3000)
+    rpm[::250] += 5000  # outliers and spikes
+    columns = [
+        rpm,
+        90 + rng.normal(0, 0.5, 2500) + np.linspace(0, 8, 2500),  # slow warm-up trend
+        rng.uniform(0, 120, 1200),
+        np.full(400, 14.7),                                       # flat series
+        rng.normal(1e5, 10, 1800),                                # large offset, small spread
+        np.linspace(10, 400, 100) + rng.normal(0, 5, 100),        # steep trend
+    ]
+
+    counts, means, stds, outliers, spikes, slopes = Correlator._pid_statistics(columns, 3.0)
+    ref = _float64_statistics(columns, 3.0)
+
+    np.testing.assert_array_equal(counts, ref[0])
+    np.testing.assert_allclose(means, ref[1], rtol=1e-6)
+    np.testing.assert_allclose(stds, ref[2], rtol=1e-4, atol=1e-6)
+    np.testing.assert_array_equal(outliers, ref[3])
+    np.testing.assert_array_equal(spikes, ref[4])
+    np.testing.assert_allclose(slopes, ref[5], rtol=1e-3, atol=1e-6)
+
+    # The same findings come out of either set of statistics
+    correlator = Correlator()
+    for i, pid in enumerate(["RPM", "COOLANT_TEMP", "SPEED", "AFR", "BARO", "MAF"]):
+        got = correlator._pid_findings(
+            pid, counts[i], means[i], stds[i], outliers[i], spikes[i], slopes[i]
+        )
+        want = correlator._pid_findings(pid, *(column[i] for column in ref))
+        assert [f.title for f in got] == [f.title for f in want]
+
+
+def _session(count=40):
+    rng = np.random.default_rng(5)
+    session = DiagnosticSession()
+    for sample in _ragged_samples(rng, count):
+        session.add_sample(sample)
+    return session
+
+
+def test_analyze_returns_a_fresh_copy_of_a_reused_result():
+    correlator = Correlator()
+    session = _session()
+
+    first = correlator.analyze(session)
+    first.findings.clear()
+    first.metrics.clear()
+    second = correlator.analyze(session)
+
+    assert second is not first
+    assert second.metrics
+    assert second.timestamp >= first.timestamp
+
+    session.add_analysis(first)
+    session.add_analysis(second)
+    assert session.analysis_results[0] is not session.analysis_results[1]
+
+
+def test_analyze_recomputes_after_samples_are_added():
+    correlator = Correlator()
+    session = _session()
+    before = correlator.analyze(session)
+
+    for sample in _ragged_samples(np.random.default_rng(6), 40):
+        session.add_sample(sample)
+
+    assert correlator.analyze(session).metrics != before.metrics
+
+
+def test_analyze_does_not_keep_the_session_alive():
+    correlator = Correlator()
+    session = _session()
+    correlator.analyze(session)
+
+    refs = [weakref.ref(session), weakref.ref(session.pid_samples[0])]
+    del session
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None]
+
+
+def test_analyze_reports_each_correlation_as_a_metric():
+    result = Correlator().analyze(_session())
+
+    pair = {"correlation_RPM_MAF", "correlation_MAF_RPM"} & result.metrics.keys()
+    assert len(pair) == 1
+    assert result.metrics[pair.pop()] > 0.9
+    assert all(isinstance(value, float) for value in result.metrics.values())
@@ -0,0 +1,55 @@
+"""Tests for DTC description search."""
+
+import json
+
+import pytest
+
+from obd_toolkit.decoders.dtc import DTCDecoder, COMMON_DTC_CODES
+
+
+QUERIES = [
+    "misfire",
+    "MISFIRE",
+    "Bank 1 Sensor",
+    "o2 sensor heater",
+    "p03",
+    "P0420",
+    "o2",
+    "a",
+    "",
+    "ecT",
+    "0300random",     # would only match across the code and the description
+    "no such fault",
+]
+
+
+def _linear_search(decoder, query):
+    """Codes matched by scanning every code and description."""
+    query = query.lower()
+    return [
+        code
+        for code, data in decoder._codes_db.items()
+        if query in code.lower() or query in data.get("description", "").lower()
+    ]
+
+
+@pytest.fixture(params=["bundled", "builtin"])
+def decoder(request, tmp_path):
+    if request.param == "bundled":
+        return DTCDecoder()
+    codes_file = tmp_path / "codes.json"
+    codes_file.write_text(json.dumps(COMMON_DTC_CODES))
+    return DTCDecoder(codes_file)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_search_matches_linear_scan(decoder, query):
+    results = decoder.search(query)
+
+    assert [info.code for info in results] == _linear_search(decoder, query)
+
+
+def test_repeated_searches_reuse_the_index(decoder):
+    first = [info.code for info in decoder.search("sensor")]
+    assert first
+    assert [info.code for info in decoder.search("SENSOR")] == first
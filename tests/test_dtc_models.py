@@ -0,0 +1,18 @@
+"""Tests for DTC models."""
+
+from obd_toolkit.models.dtc import DTCInfo, DTCReadResult, DTCType
+
+
+def test_code_views_follow_changes_to_the_code_lists(sample_dtc_codes):
+    result = DTCReadResult()
+    assert result.stored_code_set == frozenset()
+    assert not result.has_critical
+
+    for entry in sample_dtc_codes:
+        result.stored_codes.append(DTCInfo.from_code(entry["code"], entry["description"]))
+    result.pending_codes = [DTCInfo.from_code("P0420", dtc_type=DTCType.PENDING)]
+
+    assert result.stored_code_set == {"P0300", "P0420"}
+    assert result.pending_code_set == {"P0420"}
+    assert result.has_critical
+    assert "P0300" in {dtc.code for dtc in result.critical_codes}
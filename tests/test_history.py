@@ -0,0 +1,51 @@
+"""Tests for session export."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from obd_toolkit.models.session import DiagnosticSession, PIDSample
+from obd_toolkit.storage.history import HistoryManager
+
+
+def _session():
+    start = datetime(2024, 5, 1, 12, 0, 0, 250000)
+    rows = [
+        {"RPM": 800.0, "SPEED": 0.0, "COOLANT_TEMP": 85.0},
+        {"RPM": 1200.5, "SPEED": 12.0},
+        {"RPM": 2400.0, "COOLANT_TEMP": 88.0},
+        {"RPM": 1800.0, "SPEED": 40.0, "COOLANT_TEMP": 89.0, "MAF": 9.5},
+    ]
+    session = DiagnosticSession()
+    for i, values in enumerate(rows):
+        session.add_sample(PIDSample(timestamp=start + timedelta(seconds=i), values=values))
+    return session
+
+
+def test_npz_export_round_trip_with_gaps(tmp_path):
+    session = _session()
+    manager = HistoryManager(data_dir=tmp_path)
+    target = tmp_path / "export.npz"
+
+    assert manager._export_npz(session, target) == str(target)
+
+    with np.load(target) as archive:
+        assert sorted(archive.files) == ["COOLANT_TEMP", "MAF", "RPM", "SPEED", "timestamp"]
+
+        expected_times = np.array(
+            [s.timestamp for s in session.pid_samples], dtype="datetime64[us]"
+        )
+        np.testing.assert_array_equal(archive["timestamp"], expected_times)
+
+        np.testing.assert_array_equal(archive["RPM"], [800.0, 1200.5, 2400.0, 1800.0])
+        np.testing.assert_array_equal(archive["SPEED"], [0.0, 12.0, np.nan, 40.0])
+        np.testing.assert_array_equal(archive["COOLANT_TEMP"], [85.0, np.nan, 88.0, 89.0])
+        np.testing.assert_array_equal(archive["MAF"], [np.nan, np.nan, np.nan, 9.5])
+        assert all(archive[pid].dtype == np.float64 for pid in ("RPM", "SPEED", "MAF"))
+
+
+def test_npz_export_skips_empty_sessions(tmp_path):
+    target = tmp_path / "empty.npz"
+
+    assert HistoryManager(data_dir=tmp_path)._export_npz(DiagnosticSession(), target) is None
+    assert not target.exists()
@@ -0,0 +1,105 @@
+"""Tests for the live collector's sample buffer."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from obd_toolkit.collectors.live import LiveDataCollector, OverflowPolicy
+from obd_toolkit.models.session import PIDSample
+
+
+def _sample(rpm: float) -> PIDSample:
+    return PIDSample(values={"RPM": rpm})
+
+
+def _collector(mock_obd_connection, overflow, buffer_size=3):
+    manager = MagicMock()
+    manager.connection = mock_obd_connection
+    manager.is_car_connected = True
+    return LiveDataCollector(manager, pids=["RPM"], buffer_size=buffer_size, overflow=overflow)
+
+
+def _fill(collector, count):
+    for i in range(count):
+        collector._buffer_sample(_sample(float(i)))
+
+
+def _buffered(collector):
+    return [sample.values["RPM"] for sample in collector.get_buffered_samples()]
+
+
+def test_drop_old_evicts_the_oldest_sample(mock_obd_connection):
+    collector = _collector(mock_obd_connection, OverflowPolicy.DROP_OLD)
+    _fill(collector, 5)
+
+    assert _buffered(collector) == [2.0, 3.0, 4.0]
+    assert collector.get_statistics()["dropped_samples"] == 2
+
+
+def test_drop_new_keeps_the_buffered_samples(mock_obd_connection):
+    collector = _collector(mock_obd_connection, OverflowPolicy.DROP_NEW)
+    _fill(collector, 5)
+
+    assert _buffered(collector) == [0.0, 1.0, 2.0]
+    assert collector.get_statistics()["dropped_samples"] == 2
+
+
+def test_block_waits_for_the_reader(mock_obd_connection):
+    collector = _collector(mock_obd_connection, OverflowPolicy.BLOCK)
+    _fill(collector, 3)
+
+    writer = threading.Thread(target=collector._buffer_sample, args=(_sample(3.0),))
+    writer.start()
+    time.sleep(0.2)
+    assert writer.is_alive()
+
+    first = collector.get_buffered_samples(max_samples=1)
+    writer.join(timeout=1.0)
+
+    assert not writer.is_alive()
+    assert [sample.values["RPM"] for sample in first] == [0.0]
+    assert _buffered(collector) == [1.0, 2.0, 3.0]
+    assert collector.get_statistics()["dropped_samples"] == 0
+
+
+def test_block_gives_up_when_stopped(mock_obd_connection):
+    collector = _collector(mock_obd_connection, OverflowPolicy.BLOCK)
+    _fill(collector, 3)
+
+    writer = threading.Thread(target=collector._buffer_sample, args=(_sample(3.0),))
+    writer.start()
+    collector._stop_event.set()
+    writer.join(timeout=1.0)
+
+    assert not writer.is_alive()
+    assert _buffered(collector) == [0.0, 1.0, 2.0]
+    assert collector.get_statistics()["dropped_samples"] == 1
+
+
+@pytest.mark.parametrize("overflow", list(OverflowPolicy))
+def test_clear_buffer_empties_a_full_buffer(mock_obd_connection, overflow):
+    collector = _collector(mock_obd_connection, overflow)
+    _fill(collector, 3)
+
+    collector.clear_buffer()
+
+    assert collector.get_buffered_samples() == []
+
+
+def test_wait_for_samples_times_out(mock_obd_connection):
+    collector = _collector(mock_obd_connection, OverflowPolicy.DROP_OLD)
+
+    start = time.monotonic()
+    assert collector.wait_for_samples(timeout=0.1) is False
+    assert time.monotonic() - start >= 0.09
+
+
+def test_wait_for_samples_wakes_when_a_sample_is_ready(mock_obd_connection):
+    collector = _collector(mock_obd_connection, OverflowPolicy.DROP_OLD)
+    threading.Timer(0.05, collector._samples_ready.set).start()
+
+    assert collector.wait_for_samples(timeout=2.0) is True
+    # The event is consumed, so the next wait needs a new sample
+    assert collector.wait_for_samples(timeout=0.05) is False
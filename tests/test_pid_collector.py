@@ -0,0 +1,169 @@
+"""Tests for multi-PID (packed) reads in the PID collector."""
+
+from unittest.mock import MagicMock
+
+import obd
+import pytest
+from obd.protocols.protocol import Message, ECU
+
+from obd_toolkit.collectors.pid import PIDCollector
+
+
+# Raw data bytes the fake ECU returns for each PID
+ECU_DATA = {
+    "RPM": bytes([0x1A, 0xF8]),           # 1726 rpm
+    "SPEED": bytes([0x32]),               # 50 kph
+    "COOLANT_TEMP": bytes([0x7B]),        # 83 C
+    "INTAKE_TEMP": bytes([0x41]),         # 25 C
+    "ENGINE_LOAD": bytes([0x80]),
+    "THROTTLE_POS": bytes([0x33]),
+    "MAF": bytes([0x01, 0xF4]),           # 5 g/s
+    "TIMING_ADVANCE": bytes([0x90]),      # 8 degrees
+}
+
+EXPECTED = {
+    "RPM": 1726.0,
+    "SPEED": 50.0,
+    "COOLANT_TEMP": 83.0,
+    "INTAKE_TEMP": 25.0,
+    "MAF": 5.0,
+    "TIMING_ADVANCE": 8.0,
+}
+
+
+def _message(data: bytes) -> Message:
+    message = Message([])
+    message.ecu = ECU.ENGINE
+    message.data = bytearray(data)
+    return message
+
+
+class FakeECU:
+    """Answers single and multi-PID Mode 01 requests like a python-OBD connection."""
+
+    def __init__(self, connection, answer_all: bool = True, answer_packed: bool = True):
+        self.answer_all = answer_all
+        self.answer_packed = answer_packed
+        self.packed_requests = []
+        self.single_requests = []
+        self._by_pid = {obd.commands[name].pid: name for name in ECU_DATA}
+        connection.query.side_effect = self.query
+
+    def query(self, cmd, force=False):
+        requested = bytes.fromhex(cmd.command.decode())[1:]
+        if len(requested) == 1:
+            self.single_requests.append(cmd.name)
+        else:
+            self.packed_requests.append(requested)
+            if not self.answer_packed:
+                return cmd([])
+            if not self.answer_all:
+                requested = requested[:1]
+
+        data = bytearray([0x41])
+        for pid in requested:
+            data += bytes([pid]) + ECU_DATA[self._by_pid[pid]]
+        return cmd([_message(data)])
+
+
+@pytest.fixture
+def collector(mock_obd_connection):
+    mock_obd_connection.protocol_id.return_value = "6"
+    mock_obd_connection.supported_commands = {obd.commands[name] for name in ECU_DATA}
+    manager = MagicMock()
+    manager.connection = mock_obd_connection
+    manager.is_car_connected = True
+    return PIDCollector(manager)
+
+
+def _values(results):
+    return {value.pid: value.value for value in results if value.pid in EXPECTED}
+
+
+def test_full_reply_uses_one_request(collector, mock_obd_connection):
+    ecu = FakeECU(mock_obd_connection)
+    pids = ["RPM", "SPEED", "COOLANT_TEMP"]
+
+    results = collector.collect_many(pids)
+
+    assert [value.pid for value in results] == pids
+    assert all(value.is_valid for value in results)
+    assert _values(results) == {pid: EXPECTED[pid] for pid in pids}
+    assert len(ecu.packed_requests) == 1
+    assert ecu.single_requests == []
+
+
+def test_more_than_six_pids_are_split_into_groups(collector, mock_obd_connection):
+    ecu = FakeECU(mock_obd_connection)
+    pids = list(ECU_DATA)
+
+    results = collector.collect_many(pids)
+
+    assert [len(group) for group in ecu.packed_requests] == [6, 2]
+    assert ecu.single_requests == []
+    assert all(value.is_valid for value in results)
+    assert _values(results) == EXPECTED
+
+
+def test_dropped_pids_fall_back_to_single_reads(collector, mock_obd_connection):
+    ecu = FakeECU(mock_obd_connection, answer_all=False)
+    pids = ["RPM", "SPEED", "COOLANT_TEMP"]
+
+    results = collector.collect_many(pids)
+
+    assert _values(results) == {pid: EXPECTED[pid] for pid in pids}
+    assert ecu.single_requests == ["SPEED", "COOLANT_TEMP"]
+
+    # Packing is given up after repeated incomplete replies
+    for _ in range(5):
+        collector.collect_many(pids)
+    assert len(ecu.packed_requests) == 3
+
+
+def test_null_reply_falls_back_to_single_reads(collector, mock_obd_connection):
+    ecu = FakeECU(mock_obd_connection, answer_packed=False)
+    pids = ["RPM", "SPEED"]
+
+    results = collector.collect_many(pids)
+
+    assert _values(results) == {pid: EXPECTED[pid] for pid in pids}
+    assert ecu.single_requests == pids
+
+
+def test_one_failure_does_not_disable_packing(collector, mock_obd_connection):
+    ecu = FakeECU(mock_obd_connection, answer_packed=False)
+    collector.collect_many(["RPM", "SPEED"])
+
+    ecu.answer_packed = True
+    ecu.single_requests.clear()
+    collector.collect_many(["RPM", "SPEED"])
+
+    assert len(ecu.packed_requests) == 2
+    assert ecu.single_requests == []
+
+
+def test_packing_resets_on_new_connection(collector, mock_obd_connection):
+    ecu = FakeECU(mock_obd_connection, answer_packed=False)
+    for _ in range(3):
+        collector.collect_many(["RPM", "SPEED"])
+    collector.collect_many(["RPM", "SPEED"])
+    assert len(ecu.packed_requests) == 3
+
+    reconnected = MagicMock()
+    reconnected.protocol_id.return_value = "6"
+    reconnected.supported_commands = mock_obd_connection.supported_commands
+    ecu = FakeECU(reconnected)
+    collector._conn_manager.connection = reconnected
+    collector.collect_many(["RPM", "SPEED"])
+
+    assert len(ecu.packed_requests) == 1
+
+
+def test_non_can_protocol_reads_one_by_one(collector, mock_obd_connection):
+    mock_obd_connection.protocol_id.return_value = "3"
+    ecu = FakeECU(mock_obd_connection)
+
+    results = collector.collect_many(["RPM", "SPEED"])
+
+    assert _values(results) == {"RPM": 1726.0, "SPEED": 50.0}
+    assert ecu.packed_requests == []
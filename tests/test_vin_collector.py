@@ -0,0 +1,45 @@
+"""Tests for VIN extraction from raw adapter responses."""
+
+import random
+import string
+
+import pytest
+
+from obd_toolkit.collectors.vin import VINCollector
+
+
+def _reference_extract(raw):
+    """Scan for the first 17-character window with a valid WMI start."""
+    cleaned = ''.join(c for c in raw.strip().upper() if c.isalnum())
+    cleaned = cleaned.replace('I', '1').replace('O', '0').replace('Q', '0')
+    if len(cleaned) == 17:
+        return cleaned
+    for i in range(len(cleaned) - 16):
+        potential = cleaned[i:i + 17]
+        if potential[0] in '123456789ABCDEFGHJKLMNPRSTUVWXYZ':
+            return potential
+    return None
+
+
+@pytest.mark.parametrize("raw", [
+    "1HGBH41JXMN1O9186",                  # lookalike O in the serial
+    "1hgbh4ij-xmn1o9186",                 # lower case, separator, I and O
+    "00 00 1HGBH41JXMN1Q9186\r\n>",       # zero padding, line noise, Q
+    "\x00\x001HGBH41JXMN109186  ",
+    "1HGBH41JXMN109186 SEARCHING",        # trailing adapter chatter
+])
+def test_extracts_vin_from_noisy_response(raw, sample_vin):
+    assert VINCollector._extract_vin(raw) == sample_vin
+
+
+@pytest.mark.parametrize("raw", ["", "1HGBH41JXMN", "0000000000000000000", "-- NO DATA --"])
+def test_rejects_responses_without_a_vin(raw):
+    assert VINCollector._extract_vin(raw) is None
+
+
+def test_matches_window_scan_on_random_responses():
+    rng = random.Random(7)
+    alphabet = string.ascii_letters + string.digits + " :.-\r\n"
+    for _ in range(2000):
+        raw = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert VINCollector._extract_vin(raw) == _reference_extract(raw), raw